@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Shared canonical-digest helper for the capsule policy/verify tools.
+
+One implementation of the core normalization so the digest contract
+cannot drift between scripts (capsule_verify's fork used spaced JSON
+separators and never matched a stored digest).
+"""
+import json
+import hashlib
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Bound once; hashlib dispatches to OpenSSL's SHA-NI/SHA2 path.
+_sha256 = hashlib.sha256
+
+
+def norm_capsule_for_digest(c):
+    """SHA-256 hex digest of the canonical core of capsule dict ``c``."""
+    pedagogy = c.get("pedagogy") or []
+    if isinstance(pedagogy, list):
+        pedagogy = [{"kind": p.get("kind"), "text": p.get("text")}
+                    for p in pedagogy if isinstance(p, dict)]
+    else:
+        pedagogy = []
+
+    # Core keys listed in canonical (sorted) order so the serializer
+    # doesn't re-sort per capsule; compact separators match what
+    # capsule_digest writes into provenance.signing.digest.
+    core = {
+        "assumptions": c.get("assumptions") if isinstance(c.get("assumptions"), list) else [],
+        "domain": c.get("domain"),
+        "id": c.get("id"),
+        "pedagogy": pedagogy,
+        "statement": c.get("statement"),
+        "title": c.get("title"),
+        "version": c.get("version"),
+    }
+    # orjson emits UTF-8 bytes with compact separators directly; the
+    # stdlib path is byte-identical (keys above are already sorted).
+    if HAS_ORJSON:
+        canonical = orjson.dumps(core)
+    else:
+        canonical = json.dumps(core, ensure_ascii=False,
+                               separators=(',', ':')).encode("utf-8")
+    return _sha256(canonical).hexdigest()
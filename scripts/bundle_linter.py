@@ -8,11 +8,30 @@ that referenced capsules exist.
 import sys
 import os
 import json
+import functools
+import hashlib
+import importlib.util
 import argparse
+import re
 import yaml
 import glob
 from typing import Dict, List, Tuple
 
+# Prefer the libyaml C loader when available (~7x faster parsing)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# aiofiles lets the many small file reads overlap; reads fall back to
+# sequential open() when it isn't installed
+try:
+    import asyncio
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
+
 # Try to import jsonschema, but make it optional
 try:
     import jsonschema
@@ -20,56 +39,262 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+# fastjsonschema compiles the schema to a specialized function (~10x faster);
+# fall back to plain jsonschema when it isn't installed
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Validation exceptions raised by whichever validator backend is active
+_VALIDATION_ERRORS = tuple(
+    exc for exc in (
+        fastjsonschema.JsonSchemaException if HAS_FASTJSONSCHEMA else None,
+        jsonschema.ValidationError if HAS_JSONSCHEMA else None,
+    ) if exc is not None
+)
+
+
+def _load_cached_validator(schema: Dict, schema_path: str):
+    """Load or build a fastjsonschema validator cached as generated source.
+
+    The compiled source is written next to the schema keyed by the schema's
+    content hash, so later runs import the specialized module and skip both
+    schema parsing and compilation. Returns None on any cache failure.
+    """
+    schema_hash = hashlib.sha256(
+        json.dumps(schema, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    cache_path = os.path.join(
+        os.path.dirname(schema_path), "_bundle_validator.py"
+    )
+
+    def _import_validator():
+        spec = importlib.util.spec_from_file_location("_bundle_validator", cache_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if getattr(module, "VALIDATOR_SCHEMA_HASH", None) == schema_hash:
+            return module.validate
+        return None
+
+    try:
+        if os.path.exists(cache_path):
+            validator = _import_validator()
+            if validator is not None:
+                return validator
+        code = fastjsonschema.compile_to_code(schema)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(code)
+            f.write(f"\nVALIDATOR_SCHEMA_HASH = {schema_hash!r}\n")
+        return _import_validator()
+    except Exception:
+        return None
+
+
+def compile_schema(schema: Dict, schema_path: str = None):
+    """Compile a JSON schema once into a reusable validator callable.
+
+    Returns:
+        Callable raising a validation error on bad input, or None when no
+        validator backend is available.
+    """
+    if HAS_FASTJSONSCHEMA:
+        if schema_path:
+            validator = _load_cached_validator(schema, schema_path)
+            if validator is not None:
+                return validator
+        return fastjsonschema.compile(schema)
+    if HAS_JSONSCHEMA:
+        validator_cls = jsonschema.validators.validator_for(schema)
+        # Surface a malformed schema here (caught and warned about in main)
+        # rather than as an uncaught SchemaError mid-lint
+        validator_cls.check_schema(schema)
+        return validator_cls(schema).validate
+    return None
+
+
+def _read_files(paths: List[str]) -> List:
+    """Read raw bytes for each path, concurrently when aiofiles is available.
+
+    Returns:
+        List aligned with paths; each entry is bytes, or the exception that
+        the read raised.
+    """
+    if not HAS_AIOFILES:
+        results = []
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    results.append(f.read())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def _gather():
+        # Bound concurrency so large trees don't exhaust file descriptors
+        sem = asyncio.Semaphore(64)
+
+        async def _one(path):
+            async with sem:
+                try:
+                    async with aiofiles.open(path, "rb") as f:
+                        return await f.read()
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(_one(p) for p in paths))
+
+    return asyncio.run(_gather())
+
 
-def load_bundles(path: str) -> List[Dict]:
+def load_bundles(path: str) -> Tuple[List[Tuple[Dict, str]], Dict[str, str]]:
     """Load all YAML bundles from the specified directory.
 
     Returns:
-        List of dicts with bundle data plus __file__ metadata.
-        On parse errors, includes __error__ key instead.
+        (bundles, parse_errors): bundles is a list of (data, filepath) pairs;
+        parse_errors maps filepath to the parse error message. Keeping the
+        filepath out of the bundle dict lets validators see it unmodified.
     """
     items = []
+    parse_errors = {}
     pattern = os.path.join(path, "*.yaml")
-    for filepath in sorted(glob.glob(pattern)):
+    filepaths = sorted(glob.glob(pattern))
+    for filepath, raw in zip(filepaths, _read_files(filepaths)):
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-            data["__file__"] = filepath
-            items.append(data)
+            if isinstance(raw, Exception):
+                raise raw
+            data = yaml.load(raw, Loader=_SafeLoader) or {}
+            if not isinstance(data, dict):
+                # Top-level list/scalar would crash the lint pass downstream
+                parse_errors[filepath] = (
+                    f"Parse error: expected a mapping, got {type(data).__name__}"
+                )
+                continue
+            items.append((data, filepath))
         except Exception as e:
-            items.append({
-                "__file__": filepath,
-                "__error__": f"Parse error: {str(e)}"
-            })
-    return items
+            parse_errors[filepath] = f"Parse error: {str(e)}"
+    return items, parse_errors
+
+
+# Capsules are authored with a top-level `id:` line, so a cheap regex over the
+# file head covers the common case without building the full YAML tree
+_ID_LINE = re.compile(rb'(?m)^id:\s*["\']?([A-Za-z0-9._:-]+)')
+
+# Semantic version check, compiled once (single C-level scan per bundle)
+_SEMVER = re.compile(r'^\d+\.\d+\.\d+$')
+
+
+# Directories that never contain capsules — skipping them before descending
+# is the cheapest walker-level win
+_SKIP_DIRS = frozenset(
+    ("node_modules", "__pycache__", "venv", ".venv", "dist", "build")
+)
+
+
+def _load_ignore_dirs(root: str) -> frozenset:
+    """Read extra directory names to skip from <root>/.capsuleignore
+    (one name per line, # comments allowed)."""
+    try:
+        with open(os.path.join(root, ".capsuleignore"), "r", encoding="utf-8") as f:
+            return frozenset(
+                line.strip() for line in f
+                if line.strip() and not line.startswith("#")
+            )
+    except OSError:
+        return frozenset()
+
+
+def iter_yaml(root: str):
+    """Yield paths of all YAML files under root via an os.scandir walk.
+
+    scandir caches entry type info, avoiding the per-entry stat calls that
+    glob(**) and os.walk incur. Hidden and known-junk directories are pruned
+    before descending.
+    """
+    skip_dirs = _SKIP_DIRS | _load_ignore_dirs(root)
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.startswith(".") or entry.name in skip_dirs:
+                            continue
+                        stack.append(entry.path)
+                    elif entry.name.endswith((".yaml", ".yml")):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _dir_fingerprint(root: str) -> int:
+    """Cheap change marker: max mtime across the capsules directory tree.
+
+    A directory's mtime only moves when its direct children change, so the
+    top-level stat alone misses capsules added or removed inside domain
+    subdirectories — take the max over every walked directory instead.
+    Stats directories only, not files, so it stays cheap.
+    """
+    skip_dirs = _SKIP_DIRS | _load_ignore_dirs(root)
+    newest = 0
+    stack = [os.path.join(root, "capsules")]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            newest = max(newest, os.stat(dirpath).st_mtime_ns)
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.startswith(".") or entry.name in skip_dirs:
+                            continue
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return newest
 
 
 def load_capsule_ids(root: str) -> set:
     """Load all capsule IDs from the capsules directory.
 
+    Results are memoized per (root, directory fingerprint) so repeated lints
+    against the same root in one process skip the re-scan.
+
     Returns:
         Set of capsule IDs found in the capsules directory.
     """
+    return _load_capsule_ids_cached(root, _dir_fingerprint(root))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_capsule_ids_cached(root: str, fingerprint: int) -> frozenset:
     ids = set()
-    pattern = os.path.join(root, "capsules", "**", "*.yaml")
-    for filepath in sorted(glob.glob(pattern, recursive=True)):
+    filepaths = sorted(iter_yaml(os.path.join(root, "capsules")))
+    for filepath, raw in zip(filepaths, _read_files(filepaths)):
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            if isinstance(raw, Exception):
+                raise raw
+            m = _ID_LINE.search(raw[:4096])
+            if m:
+                ids.add(m.group(1).decode("utf-8"))
+                continue
+            # Fall back to a full parse (flow style, comments before id, ...)
+            data = yaml.load(raw, Loader=_SafeLoader) or {}
             capsule_id = data.get("id")
             if capsule_id:
                 ids.add(capsule_id)
         except Exception:
             pass  # Skip unparseable capsules
-    return ids
+    return frozenset(ids)
 
 
-def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, strict: bool = False) -> Tuple[List[str], List[str]]:
+def lint_bundle(bundle: Dict, validator=None, capsule_ids: set = None, strict: bool = False) -> Tuple[List[str], List[str]]:
     """Validate a single bundle.
 
     Args:
-        bundle: Parsed bundle dict with __file__ key
-        schema: JSON schema dict for validation (optional)
+        bundle: Parsed bundle dict
+        validator: Compiled schema validator callable (optional, see compile_schema)
         capsule_ids: Set of valid capsule IDs (optional)
         strict: If True, enforce stricter checks
 
@@ -78,11 +303,6 @@ def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, stri
     """
     errs, warns = [], []
 
-    # Check for parse errors
-    if "__error__" in bundle:
-        errs.append(bundle["__error__"])
-        return errs, warns
-
     # Validate required keys
     if not bundle.get("name"):
         errs.append("Missing required key: name")
@@ -96,19 +316,19 @@ def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, stri
     elif capsules and len(capsules) == 0:
         warns.append("Bundle has no capsules listed")
 
-    # Validate against JSON schema if available
-    if schema and HAS_JSONSCHEMA:
+    # One-time set for membership checks (keeps the list where order matters)
+    capsules_set = frozenset(capsules) if isinstance(capsules, list) else frozenset()
+
+    # Validate against compiled JSON schema validator if available
+    if validator is not None:
         try:
-            # Remove metadata keys before validation
-            bundle_copy = {k: v for k, v in bundle.items() if not k.startswith("__")}
-            jsonschema.validate(bundle_copy, schema)
-        except jsonschema.ValidationError as e:
+            validator(bundle)
+        except _VALIDATION_ERRORS as e:
+            message = getattr(e, "message", str(e))
             if strict:
-                errs.append(f"Schema validation error: {e.message}")
+                errs.append(f"Schema validation error: {message}")
             else:
-                warns.append(f"Schema validation warning: {e.message}")
-        except jsonschema.SchemaError as e:
-            warns.append(f"Invalid schema: {e.message}")
+                warns.append(f"Schema validation warning: {message}")
 
     # Check that referenced capsules exist
     if capsule_ids is not None and capsules:
@@ -120,7 +340,7 @@ def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, stri
     excludes = bundle.get("excludes", [])
     if excludes and capsules:
         for exc_id in excludes:
-            if exc_id in capsules:
+            if exc_id in capsules_set:
                 warns.append(
                     f"Capsule '{exc_id}' is both included and excluded "
                     "(will be excluded)"
@@ -129,8 +349,7 @@ def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, stri
     # Validate version format if present
     version = bundle.get("version")
     if version:
-        parts = str(version).split(".")
-        if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        if not _SEMVER.match(str(version)):
             warns.append(
                 f"Version should be semantic version (e.g., 1.0.0), got: {version}"
             )
@@ -161,7 +380,7 @@ def lint_bundle(bundle: Dict, schema: Dict = None, capsule_ids: set = None, stri
         elif capsules:
             # Check that all order items are in capsules
             for cap_id in order:
-                if cap_id not in capsules:
+                if cap_id not in capsules_set:
                     warns.append(
                         f"order contains '{cap_id}' which is not in capsules list"
                     )
@@ -192,11 +411,16 @@ def main() -> int:
         action="store_true",
         help="Output results as JSON"
     )
+    ap.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Stream one JSON result per line as bundles are linted, then a summary line"
+    )
     args = ap.parse_args()
 
-    # Load schema
-    schema = None
-    if HAS_JSONSCHEMA:
+    # Load schema and compile the validator once for all bundles
+    validator = None
+    if HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA:
         # Try to find schema relative to this script
         script_dir = os.path.dirname(os.path.abspath(__file__))
         schema_path = os.path.join(script_dir, "..", "schemas", "bundle.schema.v1.json")
@@ -204,6 +428,7 @@ def main() -> int:
             try:
                 with open(schema_path, "r", encoding="utf-8") as f:
                     schema = json.load(f)
+                validator = compile_schema(schema, schema_path)
             except Exception as e:
                 print(f"Warning: Could not load schema: {e}", file=sys.stderr)
     else:
@@ -214,38 +439,68 @@ def main() -> int:
     # Load capsule IDs if root provided
     capsule_ids = None
     if args.root:
-        capsule_ids = load_capsule_ids(args.root)
+        capsule_ids = frozenset(load_capsule_ids(args.root))
 
     # Load and lint bundles
-    bundles = load_bundles(args.path)
+    bundles, parse_errors = load_bundles(args.path)
 
     total_errors = 0
     total_warnings = 0
     results = []
 
-    for bundle in bundles:
-        errs, warns = lint_bundle(bundle, schema, capsule_ids, args.strict)
+    for bundle, filepath in bundles:
+        errs, warns = lint_bundle(bundle, validator, capsule_ids, args.strict)
         total_errors += len(errs)
         total_warnings += len(warns)
 
         result = {
-            "file": bundle.get("__file__", "?"),
+            "file": filepath,
             "name": bundle.get("name", "?"),
             "errors": errs,
             "warnings": warns
         }
+        if args.jsonl:
+            # Stream each result as it's produced instead of accumulating
+            json.dump(result, sys.stdout)
+            sys.stdout.write("\n")
         results.append(result)
 
+    for filepath, message in parse_errors.items():
+        total_errors += 1
+        result = {
+            "file": filepath,
+            "name": "?",
+            "errors": [message],
+            "warnings": []
+        }
+        if args.jsonl:
+            json.dump(result, sys.stdout)
+            sys.stdout.write("\n")
+        results.append(result)
+
+    # Restore directory order (parse failures were collected separately)
+    results.sort(key=lambda r: r["file"])
+    bundle_count = len(bundles) + len(parse_errors)
+
     # Output results
-    if args.json:
-        print(json.dumps({
-            "bundles": len(bundles),
+    if args.jsonl:
+        json.dump({
+            "bundles": bundle_count,
+            "errors": total_errors,
+            "warnings": total_warnings
+        }, sys.stdout)
+        sys.stdout.write("\n")
+    elif args.json:
+        # json.dump streams straight to stdout — no intermediate giant string
+        json.dump({
+            "bundles": bundle_count,
             "errors": total_errors,
             "warnings": total_warnings,
             "results": results
-        }, indent=2))
+        }, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
-        print(f"Bundles: {len(bundles)}  errors: {total_errors}  warnings: {total_warnings}")
+        print(f"Bundles: {bundle_count}  errors: {total_errors}  warnings: {total_warnings}")
         print()
 
         for result in results:
@@ -11,105 +11,290 @@ import sys
 import os
 import json
 import argparse
-import yaml
+import concurrent.futures
+import hashlib
 import re
 from typing import Dict, List, Tuple, Optional
 
+# yaml and jsonschema are imported lazily (below) so --help and cold starts
+# in editor integrations don't pay for them up front
+
+_yaml = None
+_CapsuleLoader = None
+
+
+def _get_yaml():
+    """Import yaml and build the capsule loader on first use.
+
+    Prefers the libyaml C loader when available (~5-10x faster parsing).
+    """
+    global _yaml, _CapsuleLoader
+    if _yaml is None:
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as _BaseLoader
+        except ImportError:
+            from yaml import SafeLoader as _BaseLoader
+
+        class CapsuleLoader(_BaseLoader):
+            """Loader that deduplicates short string scalars across capsules.
+
+            Keys and enum-ish values ("kind", "python", "approved", ...)
+            repeat across thousands of files; interning them collapses the
+            copies into one object each. Large scalars such as witness code
+            blocks are returned as-is — interning those would pin big
+            one-off strings in memory.
+            """
+
+        def _construct_str(loader, node):
+            value = loader.construct_scalar(node)
+            return sys.intern(value) if len(value) <= 64 else value
+
+        CapsuleLoader.add_constructor('tag:yaml.org,2002:str', _construct_str)
+        _yaml, _CapsuleLoader = yaml, CapsuleLoader
+    return _yaml, _CapsuleLoader
+
+
+_jsonschema = None  # resolved on first schema use: module, or False if absent
+
+
+def _get_jsonschema():
+    """Import jsonschema on first use; returns the module or None."""
+    global _jsonschema
+    if _jsonschema is None:
+        try:
+            import jsonschema
+            _jsonschema = jsonschema
+        except ImportError:
+            _jsonschema = False
+    return _jsonschema or None
+
+
+# orjson serializes the report several times faster than stdlib json
 try:
-    import jsonschema
-    from jsonschema import Draft7Validator
-    JSONSCHEMA_AVAILABLE = True
+    import orjson
+
+    def _dump_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
 except ImportError:
-    JSONSCHEMA_AVAILABLE = False
+    def _dump_json(obj) -> str:
+        return json.dumps(obj, indent=2)
 
-# Schema constants
+# Schema constants. Sorted forms are precomputed so error paths don't pay
+# for a sorted() call per message.
 REQUIRED_KEYS = ["id", "version", "domain", "statement"]
-ALLOWED_PEDAGOGY_KINDS = {"Socratic", "Aphorism"}
-ALLOWED_REVIEW_STATUSES = {"draft", "in_review", "approved", "deprecated"}
-ALLOWED_WITNESS_LANGUAGES = {"python", "node", "bash", "shell"}
-ALLOWED_WITNESS_FS_MODES = {"ro", "rw"}
-
-# Unicode escape pattern for detection in raw YAML
-UNICODE_ESCAPE_PATTERN = re.compile(r'\\u[0-9a-fA-F]{4}')
+_REQUIRED_SET = frozenset(REQUIRED_KEYS)
+ALLOWED_PEDAGOGY_KINDS = frozenset({"Socratic", "Aphorism"})
+ALLOWED_REVIEW_STATUSES = frozenset({"draft", "in_review", "approved", "deprecated"})
+ALLOWED_WITNESS_LANGUAGES = frozenset({"python", "node", "bash", "shell"})
+ALLOWED_WITNESS_FS_MODES = frozenset({"ro", "rw"})
+ALLOWED_PEDAGOGY_KINDS_SORTED = sorted(ALLOWED_PEDAGOGY_KINDS)
+ALLOWED_REVIEW_STATUSES_SORTED = sorted(ALLOWED_REVIEW_STATUSES)
+ALLOWED_WITNESS_LANGUAGES_SORTED = sorted(ALLOWED_WITNESS_LANGUAGES)
+ALLOWED_WITNESS_FS_MODES_SORTED = sorted(ALLOWED_WITNESS_FS_MODES)
+
+# Optional witness fields checked by a single declarative pass:
+# (field, expected type, severity, human type label)
+WITNESS_FIELD_SPEC = (
+    ("entrypoint", str, "warn", "a string"),
+    ("args", list, "err", "a list"),
+    ("env", dict, "err", "a dict"),
+    ("workdir", str, "warn", "a string"),
+    ("net", bool, "warn", "a boolean"),
+    ("stdin", str, "warn", "a string"),
+)
+
+# Unicode escape pattern for detection in raw YAML. Prefer the RE2 bindings
+# when installed: the DFA engine scans linearly with no backtracking, which
+# matters for a pattern run against every raw file.
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+UNICODE_ESCAPE_PATTERN = _scan_re.compile(r'\\u[0-9a-fA-F]{4}')
+UNICODE_ESCAPE_PATTERN_BYTES = _scan_re.compile(rb'\\u[0-9a-fA-F]{4}')
 
 # ID pattern: domain.name_vN or domain.name_vN_suffix
 ID_PATTERN = re.compile(r'^[a-z0-9_.-]+_v\d+(?:_[a-z0-9_]+)?$')
 
 
-def load_capsules(path: str) -> List[Dict]:
+def iter_capsule_files(path: str) -> List[str]:
+    """Collect sorted paths of all capsule YAML files under path.
+
+    Uses an os.scandir stack walk: DirEntry caches type info, halving the
+    per-entry syscalls of os.walk, and paths come pre-joined.
+    """
+    filepaths = []
+    stack = [path]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith((".yaml", ".yml")):
+                        filepaths.append(entry.path)
+        except OSError:
+            continue
+    filepaths.sort()
+    return filepaths
+
+
+def _load_capsule_file(filepath: str) -> Tuple[Optional[Dict], bool, Optional[str]]:
+    """Read and parse a single capsule file.
+
+    The unicode-escape scan runs here, right after the read, so no raw
+    source string outlives the load — only a boolean flag does.
+
+    Returns:
+        (data, has_unicode_escapes, error): parsed dict plus the escape-scan
+        result, or (None, False, message) on parse failure.
+    """
+    try:
+        # Read bytes and hand them straight to libyaml, which skips the
+        # Python-level UTF-8 decode step
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        yaml, loader = _get_yaml()
+        data = yaml.load(raw, Loader=loader) or {}
+        if not isinstance(data, dict):
+            # A top-level list/scalar would crash lint_capsule downstream
+            return None, False, (
+                f"Parse error: expected a mapping, got {type(data).__name__}"
+            )
+        has_escapes = bool(
+            b"\\u" in raw and UNICODE_ESCAPE_PATTERN_BYTES.search(raw)
+        )
+        return data, has_escapes, None
+    except Exception as e:
+        return None, False, f"Parse error: {str(e)}"
+
+
+def load_capsules(path: str) -> List[Tuple[str, Optional[str], Optional[Dict], Optional[str]]]:
     """Load all YAML capsules from the specified directory.
 
     Recursively walks subdirectories (e.g., capsules/llm/*.yaml).
 
     Returns:
-        List of dicts with capsule data plus __file__ and __raw__ metadata.
-        On parse errors, includes __error__ key instead.
+        List of (filepath, has_unicode_escapes, data, error) tuples; data is
+        None when error is set.
     """
     items = []
-    for root, dirs, files in os.walk(path):
-        for filename in sorted(files):
-            if filename.endswith((".yaml", ".yml")):
-                filepath = os.path.join(root, filename)
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        raw = f.read()
-                    data = yaml.safe_load(raw) or {}
-                    data["__file__"] = filepath
-                    data["__raw__"] = raw
-                    items.append(data)
-                except Exception as e:
-                    items.append({
-                        "__file__": filepath,
-                        "__error__": f"Parse error: {str(e)}"
-                    })
+    for filepath in iter_capsule_files(path):
+        data, has_escapes, error = _load_capsule_file(filepath)
+        items.append((filepath, has_escapes, data, error))
     return items
 
 
-def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
+# Per-worker lint settings, set once by the pool initializer so the schema
+# isn't re-pickled for every submitted file and the validator is built once
+# per worker rather than once per capsule
+_WORKER_STRICT = False
+_WORKER_SCHEMA = None
+_WORKER_VALIDATOR = None
+_WORKER_ROOT = ""
+
+
+def _init_worker(strict: bool, schema: Optional[Dict], root: str = "") -> None:
+    global _WORKER_STRICT, _WORKER_SCHEMA, _WORKER_VALIDATOR, _WORKER_ROOT
+    _WORKER_STRICT = strict
+    _WORKER_SCHEMA = schema
+    _WORKER_ROOT = root
+    _WORKER_VALIDATOR = None
+    jsonschema = _get_jsonschema() if schema is not None else None
+    if jsonschema is not None:
+        jsonschema.Draft7Validator.check_schema(schema)
+        _WORKER_VALIDATOR = jsonschema.Draft7Validator(schema)
+
+
+def _lint_file(filepath: str) -> Dict:
+    """Load and lint one capsule file, returning its report entry.
+
+    Fusing load+lint per file keeps the work self-contained so it can run
+    in a process pool without materializing all capsules up front.
+    """
+    data, has_escapes, error = _load_capsule_file(filepath)
+    if error is not None:
+        return {
+            "file": filepath,
+            "id": None,
+            "errors": [error],
+            "warnings": []
+        }
+    errors, warnings = lint_capsule(
+        data,
+        strict=_WORKER_STRICT,
+        schema=_WORKER_SCHEMA,
+        validator=_WORKER_VALIDATOR,
+        filepath=filepath,
+        has_unicode_escapes=has_escapes,
+        root=_WORKER_ROOT
+    )
+    return {
+        "file": filepath,
+        "id": data.get("id"),
+        "errors": errors,
+        "warnings": warnings
+    }
+
+
+def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = None,
+                 validator=None, filepath: str = "", raw: Optional[str] = None,
+                 root: str = "", has_unicode_escapes: Optional[bool] = None) -> Tuple[List[str], List[str]]:
     """Validate a single capsule.
 
     Args:
-        capsule: Parsed capsule dict with __raw__ key
+        capsule: Parsed capsule dict (no linter metadata inside)
         strict: If True, enforce stricter checks (e.g., provenance.review.status)
         schema: Optional JSON Schema dict to validate against
+        validator: Prebuilt Draft7Validator for schema; built on the fly when
+            omitted (compile once, validate many)
+        filepath: Source path, used for the domain/path consistency check
+        raw: Raw YAML source, scanned for escapes when has_unicode_escapes
+            is not supplied
+        root: Normalized capsules root directory; when set, the domain/path
+            check is a single relpath split instead of a per-call path scan
+        has_unicode_escapes: Escape-scan result precomputed by the loader,
+            letting it drop the raw source right after the read
 
     Returns:
         (errors, warnings) tuple of message lists
     """
     errs, warns = [], []
 
-    # Validate against JSON Schema if provided
-    if schema is not None:
-        if not JSONSCHEMA_AVAILABLE:
-            warns.append(
-                "JSON Schema validation requested but jsonschema package not installed. "
-                "Install with: pip install jsonschema"
-            )
-        else:
-            # Create a clean copy without metadata fields
-            clean_capsule = {k: v for k, v in capsule.items()
-                           if not k.startswith("__")}
+    # Validate against JSON Schema if provided (main warns once when the
+    # jsonschema package is missing and passes schema=None)
+    if schema is not None and (validator is not None or _get_jsonschema() is not None):
+        if validator is None:
+            validator = _get_jsonschema().Draft7Validator(schema)
+        schema_errors = sorted(validator.iter_errors(capsule),
+                             key=lambda e: e.path)
 
-            validator = Draft7Validator(schema)
-            schema_errors = sorted(validator.iter_errors(clean_capsule),
-                                 key=lambda e: e.path)
-
-            for error in schema_errors:
-                path = ".".join(str(p) for p in error.path) if error.path else "root"
-                errs.append(f"JSON Schema violation at {path}: {error.message}")
+        for error in schema_errors:
+            path = ".".join(str(p) for p in error.path) if error.path else "root"
+            errs.append(f"JSON Schema violation at {path}: {error.message}")
 
     # Check for unicode escape sequences in raw YAML (indicates bad encoding)
-    raw = capsule.get("__raw__", "")
-    if UNICODE_ESCAPE_PATTERN.search(raw):
+    # The C-level substring test skips the regex engine entirely for the
+    # common case of files containing no escapes at all
+    if has_unicode_escapes is None:
+        has_unicode_escapes = bool(
+            raw and "\\u" in raw and UNICODE_ESCAPE_PATTERN.search(raw)
+        )
+    if has_unicode_escapes:
         warns.append(
             "Contains unicode escape sequences (e.g., \\u2265). "
             "Use actual UTF-8 characters instead (e.g., ≥). "
             "Run fix_unicode_escapes.py to fix automatically."
         )
 
-    # Validate required keys
+    # Validate required keys: one C-level set difference finds absent keys,
+    # and only present ones need the truthiness check
+    missing = _REQUIRED_SET - capsule.keys()
     for key in REQUIRED_KEYS:
-        if not capsule.get(key):
+        if key in missing or not capsule[key]:
             errs.append(f"Missing required key: {key}")
 
     # Validate ID format
@@ -122,23 +307,26 @@ def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = N
 
     # Check domain/path consistency (warning only)
     # If capsule is in capsules/llm/foo.yaml, domain should be "llm"
-    filepath = capsule.get("__file__", "")
     domain = capsule.get("domain", "")
     if filepath and domain:
-        # Extract the immediate parent directory name
-        # e.g., capsules/llm/foo.yaml → llm
-        parts = filepath.replace("\\", "/").split("/")
-        # Find "capsules" in the path
-        if "capsules" in parts:
-            capsules_idx = parts.index("capsules")
-            # If there's a subdirectory between capsules/ and the file
-            if capsules_idx + 2 < len(parts):  # capsules + subdir + file
-                subdir = parts[capsules_idx + 1]
-                if subdir != domain:
-                    warns.append(
-                        f"Domain/path mismatch: domain='{domain}' but file is in '{subdir}/' subdirectory. "
-                        f"Consider moving to capsules/{domain}/ for consistency."
-                    )
+        if root:
+            # Single split against the known root — no replace/index scan
+            rel = os.path.relpath(filepath, root)
+            subdir = rel.split(os.sep, 1)[0] if os.sep in rel else None
+        else:
+            # No root supplied (library use): locate the capsules/ component
+            parts = filepath.replace("\\", "/").split("/")
+            subdir = None
+            if "capsules" in parts:
+                capsules_idx = parts.index("capsules")
+                # If there's a subdirectory between capsules/ and the file
+                if capsules_idx + 2 < len(parts):  # capsules + subdir + file
+                    subdir = parts[capsules_idx + 1]
+        if subdir is not None and subdir != domain:
+            warns.append(
+                f"Domain/path mismatch: domain='{domain}' but file is in '{subdir}/' subdirectory. "
+                f"Consider moving to capsules/{domain}/ for consistency."
+            )
 
     # Validate assumptions (if present, must be a list)
     if "assumptions" in capsule:
@@ -162,7 +350,7 @@ def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = N
 
                 if kind not in ALLOWED_PEDAGOGY_KINDS:
                     warns.append(
-                        f"pedagogy[{i}].kind='{kind}' not in {sorted(ALLOWED_PEDAGOGY_KINDS)}"
+                        f"pedagogy[{i}].kind='{kind}' not in {ALLOWED_PEDAGOGY_KINDS_SORTED}"
                     )
                 if not text or not isinstance(text, str):
                     errs.append(f"pedagogy[{i}].text must be a non-empty string")
@@ -191,24 +379,19 @@ def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = N
                 elif language not in ALLOWED_WITNESS_LANGUAGES:
                     errs.append(
                         f"witnesses[{i}].language='{language}' not in "
-                        f"{sorted(ALLOWED_WITNESS_LANGUAGES)}"
+                        f"{ALLOWED_WITNESS_LANGUAGES_SORTED}"
                     )
 
                 if not code or not isinstance(code, str):
                     errs.append(f"witnesses[{i}].code must be a non-empty string")
 
-                # Validate optional witness fields (type checking)
-                if "entrypoint" in witness and not isinstance(witness["entrypoint"], str):
-                    warns.append(f"witnesses[{i}].entrypoint should be a string")
-
-                if "args" in witness and not isinstance(witness["args"], list):
-                    errs.append(f"witnesses[{i}].args must be a list")
-
-                if "env" in witness and not isinstance(witness["env"], dict):
-                    errs.append(f"witnesses[{i}].env must be a dict")
-
-                if "workdir" in witness and not isinstance(witness["workdir"], str):
-                    warns.append(f"witnesses[{i}].workdir should be a string")
+                # Validate optional witness fields via the declarative spec
+                for field, typ, severity, label in WITNESS_FIELD_SPEC:
+                    if field in witness and not isinstance(witness[field], typ):
+                        if severity == "err":
+                            errs.append(f"witnesses[{i}].{field} must be {label}")
+                        else:
+                            warns.append(f"witnesses[{i}].{field} should be {label}")
 
                 if "timeout_ms" in witness:
                     timeout = witness["timeout_ms"]
@@ -220,20 +403,14 @@ def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = N
                     if not isinstance(memory, int) or memory <= 0:
                         warns.append(f"witnesses[{i}].memory_mb should be a positive integer")
 
-                if "net" in witness and not isinstance(witness["net"], bool):
-                    warns.append(f"witnesses[{i}].net should be a boolean")
-
                 if "fs_mode" in witness:
                     fs_mode = witness["fs_mode"]
                     if fs_mode not in ALLOWED_WITNESS_FS_MODES:
                         warns.append(
                             f"witnesses[{i}].fs_mode='{fs_mode}' not in "
-                            f"{sorted(ALLOWED_WITNESS_FS_MODES)}"
+                            f"{ALLOWED_WITNESS_FS_MODES_SORTED}"
                         )
 
-                if "stdin" in witness and not isinstance(witness["stdin"], str):
-                    warns.append(f"witnesses[{i}].stdin should be a string")
-
     # Validate provenance structure (if present)
     if "provenance" in capsule:
         prov = capsule["provenance"]
@@ -252,7 +429,7 @@ def lint_capsule(capsule: Dict, strict: bool = False, schema: Optional[Dict] = N
                 if status and status not in ALLOWED_REVIEW_STATUSES:
                     errs.append(
                         f"provenance.review.status='{status}' not in "
-                        f"{sorted(ALLOWED_REVIEW_STATUSES)}"
+                        f"{ALLOWED_REVIEW_STATUSES_SORTED}"
                     )
                 # Strict mode: require approved status for production
                 if strict and status != "approved":
@@ -290,6 +467,12 @@ def main():
         type=str,
         help="Path to JSON Schema file for validation (e.g., schemas/capsule.schema.v1.json)"
     )
+    ap.add_argument(
+        "--cache",
+        type=str,
+        metavar="FILE",
+        help="Incremental lint cache file; unchanged files (same mtime+size) are skipped"
+    )
     args = ap.parse_args()
 
     if not os.path.isdir(args.path):
@@ -298,6 +481,13 @@ def main():
 
     # Load JSON Schema if provided
     schema = None
+    if args.schema and _get_jsonschema() is None:
+        print(
+            "WARNING: JSON Schema validation requested but jsonschema package "
+            "not installed. Install with: pip install jsonschema",
+            file=sys.stderr
+        )
+        args.schema = None
     if args.schema:
         if not os.path.isfile(args.schema):
             print(f"ERROR: Schema file {args.schema} not found", file=sys.stderr)
@@ -309,31 +499,78 @@ def main():
             print(f"ERROR: Failed to load schema file: {e}", file=sys.stderr)
             sys.exit(2)
 
-    # Load and lint all capsules
-    capsules = load_capsules(args.path)
+    # Incremental mode: results for files unchanged since the last run
+    # (same mtime+size) are replayed straight from the cache. Entries are
+    # only valid for the configuration that produced them, so the cache
+    # carries a config fingerprint and is discarded wholesale on mismatch
+    # (e.g. cached non-strict results must not satisfy a --strict run).
+    config_key = hashlib.sha256(json.dumps(
+        {"strict": bool(args.strict), "schema": schema}, sort_keys=True
+    ).encode("utf-8")).hexdigest()
+    cache = {}
+    if args.cache:
+        try:
+            with open(args.cache, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except Exception:
+            cache = {}
+        if cache.get("__config__") != config_key:
+            cache = {}
+
+    capsules_root = os.path.normpath(args.path)
+    filepaths = iter_capsule_files(args.path)
+    cached_items = {}
+    pending = []
+    for fp in filepaths:
+        entry = cache.get(fp)
+        if entry:
+            try:
+                st = os.stat(fp)
+            except OSError:
+                pending.append(fp)
+                continue
+            if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                cached_items[fp] = entry[2]
+                continue
+        pending.append(fp)
+
+    # Lint the rest, fusing load+lint per file; larger trees fan out across
+    # cores (each file is independent)
+    if len(pending) < 16:
+        _init_worker(args.strict, schema, capsules_root)
+        fresh_items = [_lint_file(fp) for fp in pending]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=_init_worker, initargs=(args.strict, schema, capsules_root)
+        ) as executor:
+            fresh_items = list(executor.map(_lint_file, pending, chunksize=16))
+
+    if args.cache:
+        cache["__config__"] = config_key
+        for item in fresh_items:
+            try:
+                st = os.stat(item["file"])
+            except OSError:
+                continue
+            cache[item["file"]] = [st.st_mtime_ns, st.st_size, item]
+        try:
+            with open(args.cache, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except Exception:
+            pass  # Cache is best-effort; never fail the lint over it
+
+    # Reassemble in walk order
+    fresh_by_file = {item["file"]: item for item in fresh_items}
+    items = [
+        cached_items[fp] if fp in cached_items else fresh_by_file[fp]
+        for fp in filepaths
+    ]
+
     report = {
         "summary": {"total": 0, "errors": 0, "warnings": 0},
-        "items": []
+        "items": items
     }
 
-    for capsule in capsules:
-        if "__error__" in capsule:
-            entry = {
-                "file": capsule["__file__"],
-                "id": None,
-                "errors": [capsule["__error__"]],
-                "warnings": []
-            }
-        else:
-            errors, warnings = lint_capsule(capsule, strict=args.strict, schema=schema)
-            entry = {
-                "file": capsule.get("__file__"),
-                "id": capsule.get("id"),
-                "errors": errors,
-                "warnings": warnings
-            }
-        report["items"].append(entry)
-
     # Compute summary
     for item in report["items"]:
         report["summary"]["total"] += 1
@@ -342,7 +579,7 @@ def main():
 
     # Output report
     if args.json:
-        print(json.dumps(report, indent=2))
+        print(_dump_json(report))
     else:
         summary = report["summary"]
         print(
@@ -24,13 +24,23 @@ Usage:
 """
 import sys
 import os
+import io
 import json
+import hashlib
 import argparse
+import functools
+import mmap
+import contextlib
 import yaml
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
-from pathlib import Path
 
 try:
     import jsonschema
@@ -39,110 +49,116 @@ except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
 
+def _clone_chain(root: Dict, keys, create: bool = False) -> Optional[Dict]:
+    """Clone the dicts along ``keys`` inside ``root``; siblings stay aliased.
+
+    Returns the innermost cloned dict, or None when the chain is missing
+    and ``create`` is False. This keeps rule application O(depth) instead
+    of deep-copying the whole capsule while leaving the input untouched.
+    """
+    node = root
+    for key in keys:
+        child = node.get(key)
+        if isinstance(child, dict):
+            child = dict(child)
+        elif create:
+            child = {}
+        else:
+            return None
+        node[key] = child
+        node = child
+    return node
+
+
 class MigrationRule:
     """Represents a single migration transformation."""
 
+    __slots__ = ("rule_type", "params", "_fn", "_parent", "_leaf",
+                 "_old_parent", "_old_leaf", "_new_parent", "_new_leaf", "_fmt")
+
+    _DISPATCH = {
+        "add_field": "_add_field",
+        "rename_field": "_rename_field",
+        "remove_field": "_remove_field",
+        "transform_field": "_transform_field",
+        "set_default": "_set_default",
+    }
+
     def __init__(self, rule_type: str, **kwargs):
         self.rule_type = rule_type
         self.params = kwargs
 
+        if rule_type not in self._DISPATCH:
+            raise ValueError(f"Unknown rule type: {rule_type}")
+        self._fn = getattr(self, self._DISPATCH[rule_type])
+
+        # Pre-split dotted paths once; apply() runs once per capsule and
+        # shouldn't re-parse its own parameters every time.
+        if rule_type == "rename_field":
+            old = tuple(kwargs["old_path"].split("."))
+            new = tuple(kwargs["new_path"].split("."))
+            self._old_parent, self._old_leaf = old[:-1], old[-1]
+            self._new_parent, self._new_leaf = new[:-1], new[-1]
+        else:
+            path = tuple(kwargs["path"].split("."))
+            self._parent, self._leaf = path[:-1], path[-1]
+
+        if rule_type == "transform_field":
+            transform = kwargs["transform"]
+            self._fmt = transform.split(":", 1)[1] if transform.startswith("format:") else None
+
     def apply(self, capsule: Dict) -> Dict:
         """Apply this rule to a capsule."""
-        if self.rule_type == "add_field":
-            return self._add_field(capsule)
-        elif self.rule_type == "rename_field":
-            return self._rename_field(capsule)
-        elif self.rule_type == "remove_field":
-            return self._remove_field(capsule)
-        elif self.rule_type == "transform_field":
-            return self._transform_field(capsule)
-        elif self.rule_type == "set_default":
-            return self._set_default(capsule)
-        else:
-            raise ValueError(f"Unknown rule type: {self.rule_type}")
+        return self._fn(capsule)
 
     def _add_field(self, capsule: Dict) -> Dict:
         """Add a new field with a default value."""
-        path = self.params["path"].split(".")
-        value = self.params["value"]
-
-        current = capsule
-        for key in path[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-
-        if path[-1] not in current:
-            current[path[-1]] = value
+        parent = _clone_chain(capsule, self._parent, create=True)
+        if self._leaf not in parent:
+            parent[self._leaf] = self.params["value"]
 
         return capsule
 
     def _rename_field(self, capsule: Dict) -> Dict:
         """Rename a field."""
-        old_path = self.params["old_path"].split(".")
-        new_path = self.params["new_path"].split(".")
-
         # Get the value from old path
-        current = capsule
-        for key in old_path[:-1]:
-            if key not in current:
-                return capsule
-            current = current[key]
-
-        if old_path[-1] not in current:
+        old_parent = _clone_chain(capsule, self._old_parent)
+        if old_parent is None or self._old_leaf not in old_parent:
             return capsule
 
-        value = current.pop(old_path[-1])
+        value = old_parent.pop(self._old_leaf)
 
         # Set at new path
-        current = capsule
-        for key in new_path[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-
-        current[new_path[-1]] = value
+        new_parent = _clone_chain(capsule, self._new_parent, create=True)
+        new_parent[self._new_leaf] = value
 
         return capsule
 
     def _remove_field(self, capsule: Dict) -> Dict:
         """Remove a field."""
-        path = self.params["path"].split(".")
-
-        current = capsule
-        for key in path[:-1]:
-            if key not in current:
-                return capsule
-            current = current[key]
-
-        current.pop(path[-1], None)
+        parent = _clone_chain(capsule, self._parent)
+        if parent is not None:
+            parent.pop(self._leaf, None)
 
         return capsule
 
     def _transform_field(self, capsule: Dict) -> Dict:
         """Transform a field value using a simple expression."""
-        path = self.params["path"].split(".")
-        transform = self.params["transform"]
-
-        current = capsule
-        for key in path[:-1]:
-            if key not in current:
-                return capsule
-            current = current[key]
-
-        if path[-1] not in current:
+        leaf = self._leaf
+        parent = _clone_chain(capsule, self._parent)
+        if parent is None or leaf not in parent:
             return capsule
 
         # Apply simple transforms
+        transform = self.params["transform"]
         if transform == "to_list":
-            if not isinstance(current[path[-1]], list):
-                current[path[-1]] = [current[path[-1]]]
+            if not isinstance(parent[leaf], list):
+                parent[leaf] = [parent[leaf]]
         elif transform == "to_string":
-            current[path[-1]] = str(current[path[-1]])
-        elif transform.startswith("format:"):
+            parent[leaf] = str(parent[leaf])
+        elif self._fmt is not None:
             # e.g., "format:{}_v1" -> "foo" becomes "foo_v1"
-            fmt = transform.split(":", 1)[1]
-            current[path[-1]] = fmt.format(current[path[-1]])
+            parent[leaf] = self._fmt.format(parent[leaf])
 
         return capsule
 
@@ -154,43 +170,143 @@ class MigrationRule:
 class CapsuleMigrator:
     """Handles capsule migrations between schema versions."""
 
+    __slots__ = ("old_schema", "new_schema", "rules", "dry_run", "stats",
+                 "_new_validator", "_capsule_index", "_cache", "_rules_hash",
+                 "compile_rules", "_migrate")
+
     def __init__(self, old_schema: Optional[Dict] = None,
                  new_schema: Optional[Dict] = None,
                  rules: Optional[List[MigrationRule]] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 compile_rules: bool = False):
         self.old_schema = old_schema
         self.new_schema = new_schema
         self.rules = rules or []
         self.dry_run = dry_run
         self.stats = {"migrated": 0, "errors": 0, "skipped": 0}
 
+        # Compile the target schema once; re-validating per capsule with
+        # jsonschema.validate() would re-check and re-compile it every time.
+        self._new_validator = None
+        if new_schema and JSONSCHEMA_AVAILABLE:
+            jsonschema.Draft7Validator.check_schema(new_schema)
+            self._new_validator = jsonschema.Draft7Validator(new_schema)
+
+        # capsule-ID -> filepath indexes, one per capsules root, built
+        # lazily so bundle runs do one walk instead of a stat per ID
+        self._capsule_index: Dict[str, Dict[str, str]] = {}
+
+        # Sidecar cache of already-migrated files: {path: [src_hash, rules_hash]}.
+        # Loaded by migrate_directory; None disables the short-circuit.
+        self._cache: Optional[Dict[str, List[str]]] = None
+        self._rules_hash = hashlib.sha256(json.dumps(
+            [(r.rule_type, r.params) for r in self.rules],
+            sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+        # Optionally fuse the whole ruleset into one generated function
+        self.compile_rules = compile_rules
+        self._migrate: Optional[Callable[[Dict], Dict]] = None
+        if compile_rules and self.rules:
+            self._migrate = self._compile_rules()
+
     def migrate_capsule(self, capsule: Dict) -> Dict:
-        """Migrate a single capsule through all rules."""
-        migrated = capsule.copy()
+        """Migrate a single capsule through all rules.
 
-        # Apply each migration rule in sequence
-        for rule in self.rules:
-            try:
-                migrated = rule.apply(migrated)
-            except Exception as e:
-                print(f"  ERROR applying rule {rule.rule_type}: {e}", file=sys.stderr)
-                raise
+        The input capsule is never mutated: each rule clones only the
+        ancestor chain of the path it touches (see _clone_chain).
+        """
+        migrated = dict(capsule)
+
+        if self._migrate is not None:
+            migrated = self._migrate(migrated)
+        else:
+            # Apply each migration rule in sequence
+            for rule in self.rules:
+                try:
+                    migrated = rule.apply(migrated)
+                except Exception as e:
+                    print(f"  ERROR applying rule {rule.rule_type}: {e}", file=sys.stderr)
+                    raise
 
         # Validate against new schema if available
-        if self.new_schema and JSONSCHEMA_AVAILABLE:
-            try:
-                jsonschema.validate(migrated, self.new_schema)
-            except jsonschema.ValidationError as e:
-                print(f"  WARNING: Migrated capsule fails new schema validation: {e.message}",
+        if self._new_validator is not None:
+            errors = list(self._new_validator.iter_errors(migrated))
+            if errors:
+                print(f"  WARNING: Migrated capsule fails new schema validation: {errors[0].message}",
                       file=sys.stderr)
 
         return migrated
 
+    def _compile_rules(self) -> Callable[[Dict], Dict]:
+        """Fuse the ruleset into a single generated function.
+
+        Interpreting MigrationRule objects costs an indirect call plus
+        parameter lookups per rule per capsule. The ruleset is fixed for
+        the whole run, so emit the pipeline once as straight-line code.
+        """
+        lines = ["def _migrate(c):"]
+        ns = {"_clone_chain": _clone_chain}
+        for i, rule in enumerate(self.rules):
+            rule_type = rule.rule_type
+            if rule_type in ("add_field", "set_default"):
+                ns[f"_v{i}"] = rule.params["value"]
+                lines.append(f"    p = _clone_chain(c, {rule._parent!r}, True)")
+                lines.append(f"    if {rule._leaf!r} not in p: p[{rule._leaf!r}] = _v{i}")
+            elif rule_type == "remove_field":
+                lines.append(f"    p = _clone_chain(c, {rule._parent!r})")
+                lines.append(f"    if p is not None: p.pop({rule._leaf!r}, None)")
+            elif rule_type == "rename_field":
+                lines.append(f"    p = _clone_chain(c, {rule._old_parent!r})")
+                lines.append(f"    if p is not None and {rule._old_leaf!r} in p:")
+                lines.append(f"        _clone_chain(c, {rule._new_parent!r}, True)"
+                             f"[{rule._new_leaf!r}] = p.pop({rule._old_leaf!r})")
+            else:  # transform_field
+                transform = rule.params["transform"]
+                lines.append(f"    p = _clone_chain(c, {rule._parent!r})")
+                lines.append(f"    if p is not None and {rule._leaf!r} in p:")
+                if transform == "to_list":
+                    lines.append(f"        if not isinstance(p[{rule._leaf!r}], list): "
+                                 f"p[{rule._leaf!r}] = [p[{rule._leaf!r}]]")
+                elif transform == "to_string":
+                    lines.append(f"        p[{rule._leaf!r}] = str(p[{rule._leaf!r}])")
+                elif rule._fmt is not None:
+                    lines.append(f"        p[{rule._leaf!r}] = "
+                                 f"{rule._fmt!r}.format(p[{rule._leaf!r}])")
+                else:
+                    lines.append("        pass")
+        lines.append("    return c")
+        exec("\n".join(lines), ns)
+        return ns["_migrate"]
+
     def migrate_file(self, filepath: str) -> bool:
         """Migrate a single YAML file."""
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                capsule = yaml.safe_load(f)
+            f = open(filepath, "rb")
+            mm = None
+            try:
+                size = os.fstat(f.fileno()).st_size
+                # Map large files so hashing and parsing read straight from
+                # the page cache instead of an intermediate bytes copy; fall
+                # back to a plain read where mmap isn't supported
+                if size >= _MMAP_MIN_SIZE:
+                    try:
+                        mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        mm = None
+                raw = mm if mm is not None else f.read()
+
+                # Unchanged since the last run with the same ruleset: nothing to do
+                if self._cache is not None:
+                    src_hash = hashlib.sha256(raw).hexdigest()
+                    if self._cache.get(filepath) == [src_hash, self._rules_hash]:
+                        self.stats["skipped"] += 1
+                        return False
+
+                capsule = yaml.load(raw, Loader=_SafeLoader)
+            finally:
+                if mm is not None:
+                    mm.close()
+                f.close()
 
             if not capsule:
                 print(f"  Skipping empty file: {filepath}")
@@ -207,10 +323,23 @@ class CapsuleMigrator:
                 backup_path = f"{filepath}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 shutil.copy2(filepath, backup_path)
 
-                # Write migrated version
-                with open(filepath, "w", encoding="utf-8") as f:
-                    yaml.dump(migrated, f, default_flow_style=False,
-                            allow_unicode=True, sort_keys=False)
+                # Write migrated version: emit to a buffer, then rename into
+                # place so a crash mid-write can't leave a truncated capsule
+                buf = io.BytesIO()
+                yaml.dump(migrated, buf, Dumper=_SafeDumper, default_flow_style=False,
+                          allow_unicode=True, sort_keys=False, encoding="utf-8")
+                tmp_path = filepath + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(buf.getvalue())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, filepath)
+
+                if self._cache is not None:
+                    self._cache[filepath] = [
+                        hashlib.sha256(buf.getvalue()).hexdigest(),
+                        self._rules_hash,
+                    ]
 
                 print(f"  Migrated: {filepath}")
                 print(f"  Backup:   {backup_path}")
@@ -226,63 +355,107 @@ class CapsuleMigrator:
     def migrate_directory(self, dirpath: str, recursive: bool = True) -> int:
         """Migrate all YAML files in a directory."""
         count = 0
-        path = Path(dirpath)
 
+        # Single walk instead of separate *.yaml and *.yml globs; sorting
+        # per directory keeps the order stable without a full-list sort.
+        files = []
         if recursive:
-            pattern = "**/*.yaml"
+            for root, dirs, names in os.walk(dirpath):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.endswith((".yaml", ".yml")):
+                        files.append(os.path.join(root, name))
         else:
-            pattern = "*.yaml"
+            with os.scandir(dirpath) as it:
+                files = sorted(entry.path for entry in it
+                               if entry.is_file() and entry.name.endswith((".yaml", ".yml")))
 
-        for filepath in sorted(path.glob(pattern)):
-            if self.migrate_file(str(filepath)):
-                count += 1
-
-        # Also check for .yml files
-        if recursive:
-            pattern = "**/*.yml"
-        else:
-            pattern = "*.yml"
-
-        for filepath in sorted(path.glob(pattern)):
-            if self.migrate_file(str(filepath)):
-                count += 1
-
-        return count
+        self._cache = _load_cache(dirpath)
+        try:
+            # Each file is independent (load, apply rules, write back), so fan
+            # out across cores; a pool isn't worth the spawn cost for a handful.
+            if len(files) < _MIN_FILES_FOR_POOL:
+                for filepath in files:
+                    if self.migrate_file(filepath):
+                        count += 1
+                return count
+
+            # Pool workers don't share the cache, so filter hits up front
+            pending = []
+            for filepath in files:
+                entry = self._cache.get(filepath)
+                if entry is not None and entry[1] == self._rules_hash:
+                    with open(filepath, "rb") as f:
+                        if hashlib.sha256(f.read()).hexdigest() == entry[0]:
+                            self.stats["skipped"] += 1
+                            continue
+                pending.append(filepath)
+
+            if pending:
+                rules_data = [(r.rule_type, r.params) for r in self.rules]
+                with ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    initializer=_init_worker,
+                    initargs=(rules_data, self.new_schema, self.dry_run,
+                              self.compile_rules),
+                ) as pool:
+                    for filepath, (ok, output, stats) in zip(
+                            pending, pool.map(_migrate_one, pending, chunksize=8)):
+                        sys.stdout.write(output)
+                        for key, value in stats.items():
+                            self.stats[key] += value
+                        if ok:
+                            count += 1
+                            if not self.dry_run:
+                                with open(filepath, "rb") as f:
+                                    self._cache[filepath] = [
+                                        hashlib.sha256(f.read()).hexdigest(),
+                                        self._rules_hash,
+                                    ]
 
-    def migrate_bundle(self, bundle_path: str, capsules_root: str = "capsules") -> int:
-        """Migrate all capsules referenced in a bundle file."""
+            return count
+        finally:
+            if not self.dry_run:
+                _save_cache(dirpath, self._cache)
+            self._cache = None
+
+    def migrate_bundle(self, bundle_path: str, capsules_root: str = "capsules",
+                       bundle: Optional[Dict] = None) -> int:
+        """Migrate all capsules referenced in a bundle file.
+
+        Pass ``bundle`` when the file has already been parsed (e.g. by the
+        bundle-detection probe in main) to avoid loading it twice.
+        """
         try:
-            with open(bundle_path, "r", encoding="utf-8") as f:
-                bundle = yaml.safe_load(f)
+            if bundle is None:
+                with open(bundle_path, "r", encoding="utf-8") as f:
+                    bundle = yaml.load(f, Loader=_SafeLoader)
 
             if not bundle or "capsules" not in bundle:
                 print(f"ERROR: Bundle file {bundle_path} has no 'capsules' key",
                       file=sys.stderr)
                 return 0
 
+            index = self._capsule_index.get(capsules_root)
+            if index is None:
+                index = self._capsule_index[capsules_root] = _index_capsules(capsules_root)
+
             count = 0
+            index_get = index.get
             for capsule_id in bundle["capsules"]:
-                # Convert capsule ID to file path
+                # Resolve capsule ID via the prebuilt index instead of
+                # stat'ing candidate paths per entry
                 # e.g., "macgyver.five_rails_v1" -> "capsules/macgyver/five_rails_v1.yaml"
-                parts = capsule_id.split(".")
-                if len(parts) >= 2:
-                    domain = parts[0]
-                    name = ".".join(parts[1:])
-                    filepath = os.path.join(capsules_root, domain, f"{name}.yaml")
-
-                    if os.path.isfile(filepath):
+                domain, sep, rest = capsule_id.partition(".")
+                if sep:
+                    filepath = index_get(capsule_id) or index_get(rest)
+                    if filepath:
                         if self.migrate_file(filepath):
                             count += 1
                     else:
-                        # Try alternative paths
-                        alt_filepath = os.path.join(capsules_root, f"{name}.yaml")
-                        if os.path.isfile(alt_filepath):
-                            if self.migrate_file(alt_filepath):
-                                count += 1
-                        else:
-                            print(f"  WARNING: Capsule file not found for {capsule_id}",
-                                  file=sys.stderr)
-                            self.stats["skipped"] += 1
+                        print(f"  WARNING: Capsule file not found for {capsule_id}",
+                              file=sys.stderr)
+                        self.stats["skipped"] += 1
 
             return count
 
@@ -293,15 +466,17 @@ class CapsuleMigrator:
 
     def _print_diff(self, old: Dict, new: Dict, prefix: str = ""):
         """Print a simple diff of changes."""
-        # Find added/changed fields
-        for key in new:
-            if key not in old:
-                print(f"    + {prefix}{key}: {new[key]}")
-            elif old[key] != new[key]:
-                if isinstance(new[key], dict) and isinstance(old[key], dict):
-                    self._print_diff(old[key], new[key], prefix=f"{prefix}{key}.")
-                else:
-                    print(f"    ~ {prefix}{key}: {old[key]} -> {new[key]}")
+        # Find added/changed fields. Recurse straight into matching dicts:
+        # comparing the whole subtree with != first and then walking it
+        # again made the diff quadratic in tree size.
+        for key, new_value in new.items():
+            old_value = old.get(key, _MISSING)
+            if old_value is _MISSING:
+                print(f"    + {prefix}{key}: {new_value}")
+            elif isinstance(new_value, dict) and isinstance(old_value, dict):
+                self._print_diff(old_value, new_value, prefix=f"{prefix}{key}.")
+            elif old_value != new_value:
+                print(f"    ~ {prefix}{key}: {old_value} -> {new_value}")
 
         # Find removed fields
         for key in old:
@@ -309,6 +484,77 @@ class CapsuleMigrator:
                 print(f"    - {prefix}{key}")
 
 
+# Below this many files a worker pool costs more than it saves.
+_MIN_FILES_FOR_POOL = 16
+
+# Sentinel distinguishing "absent" from a stored None in diffs.
+_MISSING = object()
+
+# Files at least this large are mmap'ed rather than read into memory.
+_MMAP_MIN_SIZE = 16384
+
+# Sidecar written next to a migrated directory so clean re-runs short-circuit.
+CACHE_FILENAME = ".migrations_cache.json"
+
+
+def _load_cache(dirpath: str) -> Dict[str, List[str]]:
+    """Load the migration cache for a directory; missing or corrupt -> {}."""
+    try:
+        with open(os.path.join(dirpath, CACHE_FILENAME), "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(dirpath: str, cache: Dict[str, List[str]]):
+    """Persist the migration cache; failure to write is not fatal."""
+    try:
+        with open(os.path.join(dirpath, CACHE_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _index_capsules(capsules_root: str) -> Dict[str, str]:
+    """Walk capsules_root once, mapping capsule IDs to file paths.
+
+    Files under a subdirectory are keyed "subdir.name" (domain layout);
+    top-level files are keyed by bare stem to match the old fallback probe.
+    """
+    index: Dict[str, str] = {}
+    for root, dirs, names in os.walk(capsules_root):
+        rel = os.path.relpath(root, capsules_root)
+        prefix = "" if rel == "." else rel.replace(os.sep, ".") + "."
+        for name in names:
+            if name.endswith(".yaml"):
+                # f-string join: these paths are only opened, never compared
+                index.setdefault(prefix + name[:-5], f"{root}/{name}")
+    return index
+
+# Per-process migrator rebuilt from pickled rule specs by the pool initializer.
+_WORKER_MIGRATOR: Optional["CapsuleMigrator"] = None
+
+
+def _init_worker(rules_data: List, new_schema: Optional[Dict], dry_run: bool,
+                 compile_rules: bool = False):
+    """Build one CapsuleMigrator per worker process."""
+    global _WORKER_MIGRATOR
+    rules = [MigrationRule(rule_type, **params) for rule_type, params in rules_data]
+    _WORKER_MIGRATOR = CapsuleMigrator(new_schema=new_schema, rules=rules,
+                                       dry_run=dry_run, compile_rules=compile_rules)
+
+
+def _migrate_one(filepath: str):
+    """Migrate one file in a worker; returns (ok, captured stdout, stats delta)."""
+    migrator = _WORKER_MIGRATOR
+    migrator.stats = {"migrated": 0, "errors": 0, "skipped": 0}
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        ok = migrator.migrate_file(filepath)
+    return ok, buf.getvalue(), migrator.stats
+
+
 def load_migration_rules(rules_path: str) -> List[MigrationRule]:
     """Load migration rules from a JSON file."""
     with open(rules_path, "r", encoding="utf-8") as f:
@@ -322,8 +568,13 @@ def load_migration_rules(rules_path: str) -> List[MigrationRule]:
     return rules
 
 
-def get_builtin_rules(from_version: str, to_version: str) -> List[MigrationRule]:
-    """Get built-in migration rules for common schema transitions."""
+@functools.lru_cache(maxsize=16)
+def get_builtin_rules(from_version: str, to_version: str) -> tuple:
+    """Get built-in migration rules for common schema transitions.
+
+    Cached and returned as a tuple: rules are immutable after
+    construction, and worker processes may request the same pair again.
+    """
     rules = []
 
     # Example: v1.0 to v1.1 migration
@@ -359,7 +610,7 @@ def get_builtin_rules(from_version: str, to_version: str) -> List[MigrationRule]
                          value=None),
         ])
 
-    return rules
+    return tuple(rules)
 
 
 def main():
@@ -401,6 +652,11 @@ def main():
         action="store_true",
         help="Show what would be changed without writing files"
     )
+    ap.add_argument(
+        "--compile-rules",
+        action="store_true",
+        help="Fuse the ruleset into one generated function (faster on large runs)"
+    )
     ap.add_argument(
         "--capsules-root",
         type=str,
@@ -440,7 +696,8 @@ def main():
         old_schema=old_schema,
         new_schema=new_schema,
         rules=rules,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        compile_rules=args.compile_rules
     )
 
     # Determine target type and migrate
@@ -458,12 +715,12 @@ def main():
         if target.endswith((".yaml", ".yml")):
             # Check if it's a bundle or capsule
             with open(target, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_SafeLoader)
 
             if data and "capsules" in data and "name" in data:
                 # It's a bundle
                 print("Detected bundle file")
-                count = migrator.migrate_bundle(target, args.capsules_root)
+                count = migrator.migrate_bundle(target, args.capsules_root, bundle=data)
             else:
                 # It's a capsule
                 print("Detected capsule file")
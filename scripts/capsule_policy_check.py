@@ -8,37 +8,72 @@ Rules:
 - Optional: branch-based enforcement via --require-signature-on-approved flag.
 Exit non-zero on any violation.
 """
-import os, sys, json, base64, yaml, hashlib, argparse
-
-def canonical_json(obj):
-    """Canonical JSON - deterministic ordering, no whitespace."""
-    if isinstance(obj, list):
-        return "[" + ",".join(canonical_json(item) for item in obj) + "]"
-    elif isinstance(obj, dict):
-        keys = sorted(obj.keys())
-        pairs = [json.dumps(k) + ":" + canonical_json(obj[k]) for k in keys]
-        return "{" + ",".join(pairs) + "}"
-    else:
-        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+import os, sys, base64, yaml, argparse
+from concurrent.futures import ProcessPoolExecutor
 
-def norm_capsule_for_digest(c):
-    pedagogy = c.get("pedagogy") or []
-    if isinstance(pedagogy, list):
-        pedagogy = [{"kind": p.get("kind"), "text": p.get("text")} for p in pedagogy if isinstance(p, dict)]
-    else:
-        pedagogy = []
-
-    core = {
-        "id": c.get("id"),
-        "version": c.get("version"),
-        "domain": c.get("domain"),
-        "title": c.get("title"),
-        "statement": c.get("statement"),
-        "assumptions": c.get("assumptions") if isinstance(c.get("assumptions"), list) else [],
-        "pedagogy": pedagogy
-    }
-    s = canonical_json(core)
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+from _capsule_digest import norm_capsule_for_digest
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from nacl.signing import VerifyKey
+    HAVE_NACL = True
+except Exception:
+    HAVE_NACL = False
+
+# Below this many files a worker pool costs more than it saves.
+_MIN_FILES_FOR_POOL = 16
+
+# One VerifyKey per distinct pubkey (per process); decoding and
+# initializing the key per capsule is pure overhead when a repo is
+# signed by a handful of keys.
+_VERIFIERS = {}
+
+def _verify_key(pub):
+    vk = _VERIFIERS.get(pub)
+    if vk is None:
+        vk = _VERIFIERS[pub] = VerifyKey(base64.b64decode(pub))
+    return vk
+
+def check_file(fp, require_sig):
+    """Apply the policy to one capsule file; returns (checked, errors, messages)."""
+    fn = os.path.basename(fp)
+    try:
+        c = yaml.load(open(fp, "r", encoding="utf-8"), Loader=_SafeLoader) or {}
+    except Exception as e:
+        return 0, 1, [f"[error] yaml parse failed: {fn}: {e}"]
+
+    dig = norm_capsule_for_digest(c)
+    ps = (((c.get("provenance") or {}).get("signing")) or {})
+    status = ((c.get("provenance") or {}).get("review") or {}).get("status", "draft")
+
+    if ps.get("digest") != dig:
+        return 1, 1, [f"[error] digest mismatch: {fn}"]
+
+    if require_sig and status == "approved":
+        if not HAVE_NACL:
+            return 1, 1, [f"[error] approved requires signature verification but pynacl not available: {fn}"]
+        sig = ps.get("signature"); pub = ps.get("pubkey")
+        if not sig or not pub:
+            return 1, 1, [f"[error] approved requires signature+pubkey: {fn}"]
+        try:
+            _verify_key(pub).verify(dig.encode("utf-8"), base64.b64decode(sig))
+        except Exception as e:
+            return 1, 1, [f"[error] signature verification failed: {fn}: {e}"]
+
+    return 1, 0, []
+
+_WORKER_REQUIRE_SIG = False
+
+def _init_worker(require_sig):
+    global _WORKER_REQUIRE_SIG
+    _WORKER_REQUIRE_SIG = require_sig
+
+def _check_one(fp):
+    return check_file(fp, _WORKER_REQUIRE_SIG)
 
 def main():
     ap = argparse.ArgumentParser()
@@ -46,49 +81,26 @@ def main():
     ap.add_argument("--require-signature-on-approved", action="store_true")
     args = ap.parse_args()
 
-    try:
-        from nacl.signing import VerifyKey
-        HAVE_NACL = True
-    except Exception:
-        HAVE_NACL = False
+    files = [os.path.join(args.path, fn) for fn in sorted(os.listdir(args.path))
+             if fn.endswith(".yaml")]
 
     errors = 0
     checked = 0
-    for fn in sorted(os.listdir(args.path)):
-        if not fn.endswith(".yaml"): continue
-        fp = os.path.join(args.path, fn)
-        try:
-            c = yaml.safe_load(open(fp, "r", encoding="utf-8")) or {}
-        except Exception as e:
-            print(f"[error] yaml parse failed: {fn}: {e}")
-            errors += 1
-            continue
-        checked += 1
-        dig = norm_capsule_for_digest(c)
-        ps = (((c.get("provenance") or {}).get("signing")) or {})
-        status = ((c.get("provenance") or {}).get("review") or {}).get("status", "draft")
-
-        if ps.get("digest") != dig:
-            print(f"[error] digest mismatch: {fn}")
-            errors += 1
-            continue
-
-        if args.require_signature_on_approved and status == "approved":
-            if not HAVE_NACL:
-                print(f"[error] approved requires signature verification but pynacl not available: {fn}")
-                errors += 1
-                continue
-            sig = ps.get("signature"); pub = ps.get("pubkey")
-            if not sig or not pub:
-                print(f"[error] approved requires signature+pubkey: {fn}")
-                errors += 1
-                continue
-            try:
-                VerifyKey(base64.b64decode(pub)).verify(dig.encode("utf-8"), base64.b64decode(sig))
-            except Exception as e:
-                print(f"[error] signature verification failed: {fn}: {e}")
-                errors += 1
-                continue
+    # Each file is checked independently (parse + SHA-256 + optional Ed25519),
+    # all CPU-bound, so fan out across cores when there is enough work.
+    if len(files) < _MIN_FILES_FOR_POOL:
+        results = [check_file(fp, args.require_signature_on_approved) for fp in files]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_init_worker,
+                                 initargs=(args.require_signature_on_approved,)) as pool:
+            results = list(pool.map(_check_one, files, chunksize=32))
+
+    for c, e, msgs in results:
+        checked += c
+        errors += e
+        for m in msgs:
+            print(m)
 
     print(f"policy summary: checked={checked} errors={errors}")
     sys.exit(1 if errors else 0)
@@ -2,6 +2,10 @@
 #!/usr/bin/env python3
 # See README: requires pynacl for real signing; otherwise warns.
 import os, sys, argparse, base64, yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 try:
     from nacl.signing import SigningKey
     HAVE_NACL = True
@@ -15,18 +19,18 @@ def main():
     ap.add_argument("--key-id", default="demo")
     ap.add_argument("--pub", help="ed25519 public key (base64)")
     args = ap.parse_args()
-    if not os.path.isdir(args.path): 
+    if not os.path.isdir(args.path):
         print("path must be a directory"); sys.exit(2)
-    for fn in os.listdir(args.path):
-        if not fn.endswith(".yaml"): continue
-        fp = os.path.join(args.path, fn)
-        data = yaml.safe_load(open(fp,"r",encoding="utf-8"))
+
+    def sign_file(fp):
+        fn = os.path.basename(fp)
+        data = yaml.load(open(fp,"r",encoding="utf-8"), Loader=_SafeLoader)
         s = (data.get("provenance") or {}).get("signing") or {}
         digest = (s.get("digest") or "").encode("utf-8")
         if not digest:
-            print("[skip] no digest", fn); continue
+            return f"[skip] no digest {fn}"
         if not HAVE_NACL:
-            print("[warn] pynacl not installed; cannot sign", fn); continue
+            return f"[warn] pynacl not installed; cannot sign {fn}"
         sk = SigningKey(base64.b64decode(args.key))
         sig = sk.sign(digest).signature
         s["signature"] = base64.b64encode(sig).decode("ascii")
@@ -34,8 +38,19 @@ def main():
         s["key_id"] = args.key_id if hasattr(args,"key_id") else "demo"
         if args.pub: s["pubkey"] = args.pub
         data.setdefault("provenance", {})["signing"] = s
-        yaml.safe_dump(data, open(fp,"w",encoding="utf-8"), sort_keys=False, allow_unicode=True)
-        print("[ok] signed", fn)
+        yaml.dump(data, open(fp,"w",encoding="utf-8"), Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
+        return f"[ok] signed {fn}"
+
+    files = [os.path.join(args.path, fn) for fn in os.listdir(args.path) if fn.endswith(".yaml")]
+    # PyNaCl releases the GIL while signing, so threads overlap the crypto
+    if HAVE_NACL and len(files) >= 16:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            results = list(pool.map(sign_file, files))
+    else:
+        results = [sign_file(fp) for fp in files]
+    for msg in results:
+        print(msg)
 
 if __name__ == "__main__":
     main()
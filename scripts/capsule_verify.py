@@ -1,39 +1,57 @@
 
 #!/usr/bin/env python3
-import os, sys, json, base64, yaml, hashlib
+import os, sys, base64, yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 try:
     from nacl.signing import VerifyKey
     HAVE_NACL = True
 except Exception:
     HAVE_NACL = False
 
-def norm(c):
-    core = {"id":c.get("id"),"version":c.get("version"),"domain":c.get("domain"),
-            "title":c.get("title"),"statement":c.get("statement"),
-            "assumptions":c.get("assumptions") or [],
-            "pedagogy":[{"kind":p.get("kind"),"text":p.get("text")} for p in (c.get("pedagogy") or [])]}
-    import json; s=json.dumps(core, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+from _capsule_digest import norm_capsule_for_digest as norm
+
+# one VerifyKey per distinct pubkey (per process)
+_VERIFIERS = {}
+
+def _verify_key(pub):
+    vk = _VERIFIERS.get(pub)
+    if vk is None:
+        vk = _VERIFIERS[pub] = VerifyKey(base64.b64decode(pub))
+    return vk
+
+def verify_file(fp):
+    """Verify one capsule; returns (message, ok, bad)."""
+    fn = os.path.basename(fp)
+    c = yaml.load(open(fp,"r",encoding="utf-8"), Loader=_SafeLoader) or {}
+    dig = norm(c)
+    s = ((c.get("provenance") or {}).get("signing") or {})
+    if s.get("digest") != dig:
+        return f"[digest-mismatch] {fn}", 0, 1
+    if HAVE_NACL and s.get("signature") and s.get("pubkey"):
+        try:
+            _verify_key(s["pubkey"]).verify(dig.encode("utf-8"), base64.b64decode(s["signature"]))
+            return f"[ok] sig {fn}", 1, 0
+        except Exception as e:
+            return f"[bad-signature] {fn} {e}", 0, 1
+    return f"[ok] digest-only {fn}", 1, 0
 
 def main():
     path = sys.argv[1] if len(sys.argv)>1 else "./truth-capsules-v1/capsules"
+    files = [os.path.join(path, fn) for fn in os.listdir(path) if fn.endswith(".yaml")]
     ok=0; bad=0
-    for fn in os.listdir(path):
-        if not fn.endswith(".yaml"): continue
-        fp = os.path.join(path, fn)
-        c = yaml.safe_load(open(fp,"r",encoding="utf-8")) or {}
-        dig = norm(c)
-        s = ((c.get("provenance") or {}).get("signing") or {})
-        if s.get("digest") != dig:
-            print("[digest-mismatch]", fn); bad+=1; continue
-        if HAVE_NACL and s.get("signature") and s.get("pubkey"):
-            try:
-                VerifyKey(base64.b64decode(s["pubkey"])).verify(dig.encode("utf-8"), base64.b64decode(s["signature"]))
-                print("[ok] sig", fn); ok+=1
-            except Exception as e:
-                print("[bad-signature]", fn, e); bad+=1
-        else:
-            print("[ok] digest-only", fn); ok+=1
+    # parse + digest + verify are all CPU-bound and per-file independent;
+    # fan out across cores when there is enough work to amortize the pool
+    if len(files) < 16:
+        results = [verify_file(fp) for fp in files]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(pool.map(verify_file, files, chunksize=32))
+    for msg, o, b in results:
+        print(msg); ok+=o; bad+=b
     print("summary ok=", ok, "bad=", bad)
     sys.exit(1 if bad else 0)
 
@@ -19,15 +19,24 @@ Usage:
   python compose_capsules_cli.py --root truth-capsules-v1 --list-bundles
 """
 import os
+import re
 import sys
 import json
 import argparse
+import functools
 import glob
 import yaml
 import hashlib
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Optional
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Profile aliases: short name → full profile ID
 # This allows users to type --profile conversational instead of
 # --profile profile.conversational_guidance_v1
@@ -42,16 +51,82 @@ PROFILE_ALIASES = {
 }
 
 
+# Parse-cache directory (<root>/.capsule_cache), set by main(); None disables
+# caching. Parsed YAML is mirrored as JSON keyed by source mtime — JSON loads
+# an order of magnitude faster, so repeat CLI runs skip the YAML parse.
+_CACHE_DIR = None
+
+
+def _cache_path(filepath: str, mtime_ns: int) -> str:
+    key = hashlib.sha256(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_CACHE_DIR, f"{key}.{mtime_ns}.json")
+
+
 def load_yaml(filepath: str) -> dict:
     """Load a YAML file and return parsed dict with metadata."""
+    cache_file = None
+    if _CACHE_DIR is not None:
+        try:
+            cache_file = _cache_path(filepath, os.stat(filepath).st_mtime_ns)
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data["__file__"] = filepath
+            return data
+        except (OSError, ValueError):
+            pass
+
     with open(filepath, "r", encoding="utf-8") as f:
-        raw = f.read()
-    data = yaml.safe_load(raw) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
+
+    if cache_file is not None:
+        # Cache the pure content (no metadata keys); best-effort — capsules
+        # with non-JSON values (dates etc.) simply stay uncached.
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp = cache_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+
     data["__file__"] = filepath
-    data["__raw__"] = raw
     return data
 
 
+def _file_sha256(filepath: str) -> str:
+    """SHA-256 hex digest of a file without reading it whole into memory."""
+    with open(filepath, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # 3.11+: zero-copy C loop
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _load_many(paths: List[str]) -> List[dict]:
+    """Load YAML files concurrently, preserving input order.
+
+    The C loader releases the GIL while parsing and open/stat are I/O
+    bound, so threads overlap well; a handful of files stays serial.
+    """
+    if len(paths) < 4:
+        return [load_yaml(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4)) as pool:
+        return list(pool.map(load_yaml, paths))
+
+
+def _group_pedagogy(capsule: dict) -> Dict[str, List[str]]:
+    """Group a capsule's pedagogy entries into kind→[text, ...]."""
+    by_kind = {}
+    pedagogy = capsule.get("pedagogy", [])
+    if isinstance(pedagogy, list):
+        for p in pedagogy:
+            by_kind.setdefault(p.get("kind", "").lower(), []).append(p.get("text", ""))
+    return by_kind
+
+
 def index_capsules(root: str) -> Dict[str, dict]:
     """Build an ID→capsule dict from the capsules directory.
 
@@ -59,11 +134,19 @@ def index_capsules(root: str) -> Dict[str, dict]:
     Capsules are indexed by their 'id' field, not by file path.
     """
     caps = {}
-    pattern = os.path.join(root, "capsules", "**", "*.yaml")
-    for filepath in sorted(glob.glob(pattern, recursive=True)):
-        capsule = load_yaml(filepath)
+    # os.walk visits each directory once via scandir; recursive glob
+    # re-stats every entry against the pattern on top of the walk.
+    paths = []
+    for dirpath, _dirs, filenames in os.walk(os.path.join(root, "capsules")):
+        for fn in filenames:
+            if fn.endswith(".yaml"):
+                paths.append(os.path.join(dirpath, fn))
+    paths.sort()
+    for filepath, capsule in zip(paths, _load_many(paths)):
         capsule_id = capsule.get("id") or os.path.splitext(os.path.basename(filepath))[0]
         capsule["id"] = capsule_id
+        # Normalize pedagogy once here so projections never rescan the list
+        capsule["__pedagogy_by_kind__"] = _group_pedagogy(capsule)
         caps[capsule_id] = capsule
     return caps
 
@@ -72,8 +155,8 @@ def index_bundles(root: str) -> Dict[str, dict]:
     """Build a name→bundle dict from the bundles directory."""
     bundles = {}
     pattern = os.path.join(root, "bundles", "*.yaml")
-    for filepath in sorted(glob.glob(pattern)):
-        bundle = load_yaml(filepath)
+    paths = sorted(glob.glob(pattern))
+    for filepath, bundle in zip(paths, _load_many(paths)):
         name = bundle.get("name") or os.path.splitext(os.path.basename(filepath))[0]
         bundle["name"] = name
         bundles[name] = bundle
@@ -84,26 +167,29 @@ def index_profiles(root: str) -> Dict[str, dict]:
     """Build an ID→profile dict from the profiles directory."""
     profiles = {}
     pattern = os.path.join(root, "profiles", "*.yaml")
-    for filepath in sorted(glob.glob(pattern)):
-        profile = load_yaml(filepath)
+    paths = sorted(glob.glob(pattern))
+    for filepath, profile in zip(paths, _load_many(paths)):
         profile_id = profile.get("id") or os.path.splitext(os.path.basename(filepath))[0]
         profile["id"] = profile_id
         profiles[profile_id] = profile
     return profiles
 
 
+# Alias → full ID, with full IDs mapping to themselves so resolve_profile
+# is a single fused lookup instead of profiles → aliases → profiles.
+_PROFILE_NAME_MAP = {**{pid: pid for pid in PROFILE_ALIASES.values()}, **PROFILE_ALIASES}
+
+
 def resolve_profile(name: str, profiles: Dict[str, dict]) -> Optional[dict]:
     """Resolve profile by exact ID or alias."""
-    # Try exact match first
-    if name in profiles:
-        return profiles[name]
-    # Try alias
-    full_id = PROFILE_ALIASES.get(name)
-    if full_id and full_id in profiles:
-        return profiles[full_id]
-    return None
+    return profiles.get(_PROFILE_NAME_MAP.get(name, name))
+
 
+# Field spec syntax: "field.path" with an optional "[:N]" slice suffix.
+_FIELD_SPEC_RE = re.compile(r'^([a-z_.]+)(?:\[:(\d+)\])?$')
 
+
+@functools.lru_cache(maxsize=256)
 def parse_field_spec(spec: str) -> tuple[str, Optional[int]]:
     """Parse field specification with optional slice.
 
@@ -118,14 +204,19 @@ def parse_field_spec(spec: str) -> tuple[str, Optional[int]]:
     Returns:
         Tuple of (field_path, limit) where limit is None if no slice
     """
-    import re
-    match = re.match(r'^([a-z_.]+)(?:\[:(\d+)\])?$', spec)
+    match = _FIELD_SPEC_RE.match(spec)
     if not match:
         return spec, None
     field_path, limit = match.groups()
     return field_path, int(limit) if limit else None
 
 
+# Projection results keyed by (capsule identity, include specs). Capsules
+# live in the index for the whole run, so id() is a stable key here, and
+# the same projection is applied to every capsule in a composition.
+_PROJECTION_CACHE: Dict[tuple, dict] = {}
+
+
 def apply_projection(capsule: dict, projection: dict) -> dict:
     """Apply projection rules to a capsule.
 
@@ -141,27 +232,52 @@ def apply_projection(capsule: dict, projection: dict) -> dict:
         # No projection, return full capsule
         return capsule
 
+    cache_key = (id(capsule), tuple(include_specs))
+    cached = _PROJECTION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     projected = {
         "id": capsule.get("id"),
         "version": capsule.get("version"),
         "domain": capsule.get("domain")
     }
 
-    for spec in include_specs:
-        field_path, limit = parse_field_spec(spec)
+    parsed_specs = [parse_field_spec(spec) for spec in include_specs]
 
+    # Fast path: all specs name simple top-level fields, so no pedagogy
+    # grouping or per-spec prefix dispatch is needed
+    if all("." not in field_path for field_path, _ in parsed_specs):
+        for field_path, limit in parsed_specs:
+            value = capsule.get(field_path)
+            if value is None:
+                continue
+            if isinstance(value, list) and limit is not None:
+                value = value[:limit]
+            projected[field_path] = value
+        _PROJECTION_CACHE[cache_key] = projected
+        return projected
+
+    # Pedagogy is grouped by kind at index time; capsules loaded outside
+    # the index (explicit --capsule file paths) are grouped on demand
+    by_kind = None
+    if any(spec.startswith("pedagogy.") for spec in include_specs):
+        by_kind = capsule.get("__pedagogy_by_kind__")
+        if by_kind is None:
+            by_kind = _group_pedagogy(capsule)
+
+    for field_path, limit in parsed_specs:
         # Handle nested pedagogy fields
         if field_path.startswith("pedagogy."):
-            pedagogy_type = field_path.split(".", 1)[1]  # e.g., "socratic" or "aphorisms"
-            pedagogy = capsule.get("pedagogy", [])
-            if not isinstance(pedagogy, list):
+            if by_kind is None:
                 continue
+            pedagogy_type = field_path.split(".", 1)[1]  # e.g., "socratic" or "aphorisms"
 
-            # Filter by kind
+            # Specs use the plural for aphorisms; capsules store singular kinds
             if pedagogy_type == "socratic":
-                items = [p.get("text", "") for p in pedagogy if p.get("kind", "").lower() == "socratic"]
+                items = by_kind.get("socratic", [])
             elif pedagogy_type == "aphorisms":
-                items = [p.get("text", "") for p in pedagogy if p.get("kind", "").lower() == "aphorism"]
+                items = by_kind.get("aphorism", [])
             else:
                 continue
 
@@ -169,9 +285,6 @@ def apply_projection(capsule: dict, projection: dict) -> dict:
             if limit is not None:
                 items = items[:limit]
 
-            # Store in projected capsule
-            if pedagogy_type not in projected:
-                projected[pedagogy_type] = []
             projected[pedagogy_type] = items
 
         else:
@@ -186,6 +299,7 @@ def apply_projection(capsule: dict, projection: dict) -> dict:
 
             projected[field_path] = value
 
+    _PROJECTION_CACHE[cache_key] = projected
     return projected
 
 
@@ -233,31 +347,73 @@ def build_control_table(capsules: List[dict], priority_overrides: dict = None) -
 
         rows.append((priority, cap_id, directive))
 
-    # Sort by priority (lower first), then by ID
-    rows.sort(key=lambda x: (x[0], x[1]))
+    # Sort by priority (lower first), then by ID; itemgetter runs in C
+    rows.sort(key=itemgetter(0, 1))
 
-    # Format table
-    lines = []
-    lines.append("SYSTEM: Capsule Control Table (compiled)")
-    lines.append("| Pri | Capsule ID                           | Directive                  |")
-    lines.append("|-----|--------------------------------------|----------------------------|")
-
-    for priority, cap_id, directive in rows:
-        # Pad to fixed widths for readability
-        lines.append(f"| {priority:3d} | {cap_id:36s} | {directive:26s} |")
+    # Format table; bind the row formatter once instead of re-parsing an
+    # f-string spec per row
+    row_fmt = "| {:3d} | {:36s} | {:26s} |".format
+    lines = [
+        "SYSTEM: Capsule Control Table (compiled)",
+        "| Pri | Capsule ID                           | Directive                  |",
+        "|-----|--------------------------------------|----------------------------|",
+    ]
+    lines.extend(row_fmt(*row) for row in rows)
 
     return "\n".join(lines)
 
 
-def compose_text(
+def _render_default_capsule(cap: dict, include_pedagogy: bool):
+    """Yield one capsule's lines using the default render templates.
+
+    Fast path for the common no-customization case: plain f-strings in
+    place of per-line str.format() against template strings.
+    """
+    yield (f"BEGIN CAPSULE id={cap.get('id', '?')} "
+           f"version={cap.get('version', '?')} domain={cap.get('domain', '?')}")
+    if cap.get("title"):
+        yield f"TITLE: {cap['title']}"
+    if cap.get("statement"):
+        yield f"STATEMENT: {cap['statement']}"
+
+    assumptions = cap.get("assumptions")
+    if assumptions:
+        if not isinstance(assumptions, list):
+            assumptions = [assumptions]
+        yield "ASSUMPTIONS:"
+        for a in assumptions:
+            yield f"  - {a}"
+
+    if include_pedagogy:
+        socratic = cap.get("socratic", [])
+        if socratic:
+            yield "SOCRATIC:"
+            for text in socratic:
+                yield f"  - {text.strip()}"
+        aphorisms = cap.get("aphorisms", [])
+        if aphorisms:
+            yield "APHORISMS:"
+            for text in aphorisms:
+                yield f"  - {text.strip()}"
+
+    yield ("ENFORCEMENT: Ensure outputs satisfy this capsule; "
+           "otherwise abstain and request the minimal missing info.")
+    yield "END CAPSULE"
+    yield ""
+
+
+def iter_compose_lines(
     profile: dict,
     capsules: List[dict],
     projection: dict = None,
     include_pedagogy: bool = True,
     control_table_enabled: bool = False,
     priority_overrides: dict = None
-) -> str:
-    """Compose the final system prompt text.
+):
+    """Yield the system prompt line by line.
+
+    Generator form of compose_text so callers can stream lines straight
+    to a file without materializing the whole prompt in memory.
 
     Args:
         profile: Profile dict with response block
@@ -266,11 +422,7 @@ def compose_text(
         include_pedagogy: Whether to include Socratic/Aphorism sections
         control_table_enabled: Whether to include control table
         priority_overrides: Optional priority overrides for control table
-
-    Returns:
-        Formatted system prompt as string
     """
-    lines = []
     response = profile.get("response", {})
 
     # Determine effective projection
@@ -283,31 +435,48 @@ def compose_text(
     # Profile header: use system_block if present
     system_block = response.get("system_block")
     if system_block:
-        lines.append(system_block.strip())
+        yield system_block.strip()
     else:
         # Construct from individual fields
-        lines.append(
+        yield (
             f"SYSTEM: Profile={profile.get('title', '?')} "
             f"(id={profile.get('id', '?')}, v={profile.get('version', '?')})"
         )
         if response.get("policy"):
-            lines.append(f"POLICY: {response['policy'].strip()}")
+            yield f"POLICY: {response['policy'].strip()}"
         if response.get("format"):
-            lines.append(f"FORMAT: {response['format']}")
+            yield f"FORMAT: {response['format']}"
 
     # Schema reference hint
     if response.get("schema_ref"):
-        lines.append("")
-        lines.append(f"SYSTEM: SCHEMA_REF {response['schema_ref']}")
+        yield ""
+        yield f"SYSTEM: SCHEMA_REF {response['schema_ref']}"
 
     # Control table (if enabled)
     if control_table_enabled:
-        lines.append("")
-        lines.append(build_control_table(capsules, priority_overrides))
+        yield ""
+        yield build_control_table(capsules, priority_overrides)
 
     # Capsule rules section
-    lines.append("")
-    lines.append("SYSTEM: Capsule Rules (Selected)")
+    yield ""
+    yield "SYSTEM: Capsule Rules (Selected)"
+
+    # Resolve render templates once; they are invariant across capsules
+    header_template = render_templates.get(
+        "capsule_header",
+        "BEGIN CAPSULE id={id} version={version} domain={domain}"
+    )
+    assumption_template = render_templates.get("assumption_bullet", "  - {text}")
+    socratic_template = render_templates.get("socratic_bullet", "  - {text}")
+    aphorism_template = render_templates.get("aphorism_bullet", "  - {text}")
+    enforcement_template = render_templates.get(
+        "enforcement_footer",
+        "ENFORCEMENT: Ensure outputs satisfy this capsule; otherwise abstain and request the minimal missing info."
+    )
+
+    # With no template customization, render via the specialized f-string
+    # path and skip the per-line .format() calls
+    default_render = not render_templates
 
     for capsule in capsules:
         # Apply projection if available
@@ -316,63 +485,72 @@ def compose_text(
         else:
             projected_capsule = capsule
 
+        if default_render:
+            yield from _render_default_capsule(projected_capsule, include_pedagogy)
+            continue
+
         # Render capsule header
-        header_template = render_templates.get(
-            "capsule_header",
-            "BEGIN CAPSULE id={id} version={version} domain={domain}"
-        )
-        header = header_template.format(
+        yield header_template.format(
             id=projected_capsule.get("id", "?"),
             version=projected_capsule.get("version", "?"),
             domain=projected_capsule.get("domain", "?")
         )
-        lines.append(header)
 
         # Title
         if projected_capsule.get("title"):
-            lines.append(f"TITLE: {projected_capsule['title']}")
+            yield f"TITLE: {projected_capsule['title']}"
 
         # Statement
         if projected_capsule.get("statement"):
-            lines.append(f"STATEMENT: {projected_capsule['statement']}")
+            yield f"STATEMENT: {projected_capsule['statement']}"
 
         # Assumptions
         assumptions = projected_capsule.get("assumptions")
         if assumptions:
             if not isinstance(assumptions, list):
                 assumptions = [assumptions]
-            lines.append("ASSUMPTIONS:")
-            assumption_template = render_templates.get("assumption_bullet", "  - {text}")
+            yield "ASSUMPTIONS:"
             for a in assumptions:
-                lines.append(assumption_template.format(text=str(a)))
+                yield assumption_template.format(text=str(a))
 
         # Pedagogy sections (if not filtered by compact mode)
         if include_pedagogy:
             # Socratic prompts
             socratic = projected_capsule.get("socratic", [])
             if socratic:
-                lines.append("SOCRATIC:")
-                socratic_template = render_templates.get("socratic_bullet", "  - {text}")
+                yield "SOCRATIC:"
                 for text in socratic:
-                    lines.append(socratic_template.format(text=text.strip()))
+                    yield socratic_template.format(text=text.strip())
 
             # Aphorisms
             aphorisms = projected_capsule.get("aphorisms", [])
             if aphorisms:
-                lines.append("APHORISMS:")
-                aphorism_template = render_templates.get("aphorism_bullet", "  - {text}")
+                yield "APHORISMS:"
                 for text in aphorisms:
-                    lines.append(aphorism_template.format(text=text.strip()))
+                    yield aphorism_template.format(text=text.strip())
 
         # Enforcement footer
-        enforcement_template = render_templates.get(
-            "enforcement_footer",
-            "ENFORCEMENT: Ensure outputs satisfy this capsule; otherwise abstain and request the minimal missing info."
-        )
-        lines.append(enforcement_template)
-        lines.append("END CAPSULE")
-        lines.append("")
+        yield enforcement_template
+        yield "END CAPSULE"
+        yield ""
+
 
+def compose_text(
+    profile: dict,
+    capsules: List[dict],
+    projection: dict = None,
+    include_pedagogy: bool = True,
+    control_table_enabled: bool = False,
+    priority_overrides: dict = None
+) -> str:
+    """Compose the final system prompt text (joined form of iter_compose_lines)."""
+    lines = iter_compose_lines(
+        profile, capsules,
+        projection=projection,
+        include_pedagogy=include_pedagogy,
+        control_table_enabled=control_table_enabled,
+        priority_overrides=priority_overrides,
+    )
     return "\n".join(lines).rstrip() + "\n"
 
 
@@ -448,6 +626,11 @@ def main() -> int:
         "--manifest",
         help="Output manifest JSON file path (optional)"
     )
+    ap.add_argument(
+        "--pretty-manifest",
+        action="store_true",
+        help="Indent the manifest JSON for human reading (default is compact)"
+    )
     ap.add_argument(
         "--projection",
         help="Override profile's default projection (e.g., 'ci', 'compact', 'full')"
@@ -475,20 +658,24 @@ def main() -> int:
     )
     args = ap.parse_args()
 
-    # Load indices
-    profiles = index_profiles(args.root)
-    bundles = index_bundles(args.root)
-    capsules_index = index_capsules(args.root)
+    global _CACHE_DIR
+    _CACHE_DIR = os.path.join(args.root, ".capsule_cache")
 
-    # Handle list commands
+    # Handle list commands first; each loads only the index it prints,
+    # so e.g. --list-profiles never parses the capsule tree.
     if args.list_profiles:
-        list_profiles(profiles)
+        list_profiles(index_profiles(args.root))
         return 0
 
     if args.list_bundles:
-        list_bundles(bundles)
+        list_bundles(index_bundles(args.root))
         return 0
 
+    # Load the indices the compose path actually needs
+    profiles = index_profiles(args.root)
+    bundles = index_bundles(args.root) if args.bundle else {}
+    capsules_index = index_capsules(args.root)
+
     # Validate compose requirements
     if not args.profile or not args.out:
         print("ERROR: --profile and --out are required for composition", file=sys.stderr)
@@ -576,31 +763,22 @@ def main() -> int:
     if all_excludes:
         selected_capsules = [c for c in selected_capsules if c["id"] not in all_excludes]
 
-    # Apply explicit ordering (bundle v1.1 feature)
+    # Apply explicit ordering (bundle v1.1 feature). dict.fromkeys keeps
+    # first-seen insertion order, so merging the bundle order with the
+    # selection order yields listed capsules first and the rest trailing
+    # in their original relative order — no sort, no deletes.
     if explicit_order:
-        # Build a map of capsule ID → capsule
-        capsule_map = {c["id"]: c for c in selected_capsules}
-
-        # Reorder according to explicit_order, then append remaining in original order
-        reordered = []
-        for cap_id in explicit_order:
-            if cap_id in capsule_map:
-                reordered.append(capsule_map[cap_id])
-                del capsule_map[cap_id]  # Remove from map so we don't add it twice
-
-        # Append remaining capsules (not in explicit order) in their original order
-        for capsule in selected_capsules:
-            if capsule["id"] in capsule_map:
-                reordered.append(capsule)
-
-        selected_capsules = reordered
+        by_id = {c["id"]: c for c in selected_capsules}
+        ordered_ids = dict.fromkeys(explicit_order)
+        ordered_ids.update(dict.fromkeys(by_id))
+        selected_capsules = [by_id[i] for i in ordered_ids if i in by_id]
 
     if not selected_capsules:
         print("ERROR: No capsules selected. Specify at least one --bundle or --capsule", file=sys.stderr)
         return 3
 
     # Compose prompt with new parameters (bundle v1.1 support)
-    prompt_text = compose_text(
+    prompt_lines = iter_compose_lines(
         profile=profile,
         capsules=selected_capsules,
         projection=None,  # Uses profile's projection by default
@@ -609,10 +787,23 @@ def main() -> int:
         priority_overrides=all_priority_overrides if all_priority_overrides else None
     )
 
-    # Write output
+    # Stream lines straight to the output file instead of building the whole
+    # prompt in memory. Binary mode with pre-encoded bytes skips the text
+    # I/O layer and newline translation. Blank lines are held back so
+    # trailing ones are dropped, matching compose_text's rstrip semantics
+    # byte for byte.
     os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-    with open(args.out, "w", encoding="utf-8") as f:
-        f.write(prompt_text)
+    with open(args.out, "wb") as f:
+        blanks = 0
+        for line in prompt_lines:
+            if line == "":
+                blanks += 1
+                continue
+            if blanks:
+                f.write(b"\n" * blanks)
+                blanks = 0
+            f.write(line.encode("utf-8"))
+            f.write(b"\n")
 
     print(f"✓ Wrote {args.out} ({len(selected_capsules)} capsules)")
 
@@ -627,24 +818,29 @@ def main() -> int:
                 "version": bundle.get("version", "1.0.0")  # Default to 1.0.0 if not specified
             })
 
-        # Build capsule info with file paths and SHA256 hashes
-        capsule_info = []
-        for capsule in selected_capsules:
-            filepath = capsule.get("__file__", "")
-            # Calculate SHA256 hash if file exists
-            sha256_hash = None
-            if filepath and os.path.exists(filepath):
+        # Build capsule info with file paths and SHA256 hashes. file_digest
+        # releases the GIL while hashing, so threads overlap the disk reads.
+        def _hash_or_none(filepath):
+            # No exists() probe: just open and let a missing file raise,
+            # saving a stat per capsule
+            if filepath:
                 try:
-                    with open(filepath, "rb") as f:
-                        sha256_hash = hashlib.sha256(f.read()).hexdigest()
-                except Exception:
+                    return _file_sha256(filepath)
+                except OSError:
                     pass
+            return None
 
-            capsule_info.append({
-                "id": capsule["id"],
-                "file": filepath,
-                "sha256": sha256_hash
-            })
+        filepaths = [capsule.get("__file__", "") for capsule in selected_capsules]
+        if len(filepaths) < 4:
+            hashes = [_hash_or_none(fp) for fp in filepaths]
+        else:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                hashes = list(pool.map(_hash_or_none, filepaths))
+
+        capsule_info = [
+            {"id": capsule["id"], "file": filepath, "sha256": sha256_hash}
+            for capsule, filepath, sha256_hash in zip(selected_capsules, filepaths, hashes)
+        ]
 
         manifest = {
             "profile": profile.get("id"),
@@ -656,8 +852,15 @@ def main() -> int:
             "abstain_policy": "ask-one-then-abstain",
             "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
         }
-        with open(args.manifest, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
+        # Compact separators by default: the manifest is machine-read, and
+        # skipping the pretty-printer roughly halves the bytes written.
+        # Serialize once and write the encoded bytes directly.
+        if args.pretty_manifest:
+            payload = json.dumps(manifest, indent=2)
+        else:
+            payload = json.dumps(manifest, separators=(",", ":"))
+        with open(args.manifest, "wb") as f:
+            f.write(payload.encode("utf-8"))
         print(f"✓ Wrote {args.manifest}")
 
     return 0
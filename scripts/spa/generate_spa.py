@@ -8,17 +8,28 @@ Truth Capsules — Single-file SPA generator (golden)
 • Single render path (no duplicate logic)
 """
 
-import argparse, json, os, sys, glob, yaml, hashlib
+import argparse, copy, json, os, sys, glob, yaml, hashlib, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 from jinja2 import Template
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # -------------------------------
 # CDN inventory (first is preferred)
 # -------------------------------
 UNPKG = "https://unpkg.com/"
 
+# libyaml's C loader when available (2-3x faster parse, same semantics)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 CDN_ALTS = {
     # CSS
     "prism_css": [
@@ -121,26 +132,72 @@ def embed_libs(vendor_dir: str, offline: bool):
             digests[key] = f"missing ({e})"
     return libs, digests
 
+# Parsed-YAML LRU keyed by path, validated against (mtime, size) so repeat
+# invocations skip the re-parse entirely. Hits return a deepcopy because
+# downstream code mutates the dicts.
+_YAML_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_YAML_CACHE_MAX = 256
+_YAML_CACHE_LOCK = threading.Lock()
+
+
 def read_yaml(filepath: str):
     """Read YAML; attach source path and raw for provenance/debug."""
     try:
+        st = os.stat(filepath)
+        stamp = (st.st_mtime, st.st_size)
+        with _YAML_CACHE_LOCK:
+            hit = _YAML_CACHE.get(filepath)
+            if hit is not None and hit[0] == stamp:
+                _YAML_CACHE.move_to_end(filepath)
+                return copy.deepcopy(hit[1])
+
         with open(filepath, "r", encoding="utf-8") as f:
             raw = f.read()
-        data = yaml.safe_load(raw)
+        data = yaml.load(raw, Loader=_YamlLoader)
         if isinstance(data, dict):
             data["_file"] = filepath
             data["_raw"] = raw
+
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[filepath] = (stamp, data)
+            _YAML_CACHE.move_to_end(filepath)
+            while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+        return data
+    except Exception as e:
+        return {"__error__": str(e), "_file": filepath}
+
+def read_yaml_fast(filepath: str):
+    """Parse YAML straight from the file handle; no raw text retained.
+
+    For callers that never need `_raw`: libyaml consumes the stream
+    directly, skipping the whole-file string allocation read_yaml pays.
+    """
+    try:
+        st = os.stat(filepath)
+        stamp = (st.st_mtime, st.st_size)
+        with _YAML_CACHE_LOCK:
+            hit = _YAML_CACHE.get(filepath)
+            if hit is not None and hit[0] == stamp:
+                _YAML_CACHE.move_to_end(filepath)
+                return copy.deepcopy(hit[1])
+
+        with open(filepath, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        if isinstance(data, dict):
+            data["_file"] = filepath
         return data
     except Exception as e:
         return {"__error__": str(e), "_file": filepath}
 
+
 def index_llm_templates(root_dir: str):
     templates = []
     templates_dir = os.path.join(root_dir, "llm_templates")
     if not os.path.isdir(templates_dir):
         return templates
     for filepath in sorted(glob.glob(os.path.join(templates_dir, "*.yaml"))):
-        data = read_yaml(filepath)
+        data = read_yaml_fast(filepath)
         if not isinstance(data, dict):
             continue
         required = ["id", "label", "model", "input_mode", "cmd_template"]
@@ -161,8 +218,32 @@ def index_llm_templates(root_dir: str):
 def collect_data(root_dir: str):
     """
     Walk repo and collect capsules, bundles, profiles, schemas, and llm templates.
-    Adds derived capsule['posture'] and _witness_count.
+    Adds derived capsule['posture'], _witness_count and _ped.
     """
+    def _bucket_pedagogy(obj: dict) -> dict:
+        # Mirror the SPA's normalizePedagogy so the browser can use the
+        # buckets directly instead of rescanning pedagogy on every compose.
+        out = {"socratic": [], "aphorisms": []}
+        p = obj.get("pedagogy")
+        if isinstance(p, list):
+            for item in p:
+                if not isinstance(item, dict):
+                    continue
+                kind = str(item.get("kind") or "").lower()
+                text = item.get("text")
+                if text is None or text == "":
+                    continue
+                if kind == "socratic":
+                    out["socratic"].append(str(text))
+                elif kind in ("aphorism", "aphorisms"):
+                    out["aphorisms"].append(str(text))
+        elif isinstance(p, dict):
+            if isinstance(p.get("socratic"), list):
+                out["socratic"].extend(str(t) for t in p["socratic"])
+            if isinstance(p.get("aphorisms"), list):
+                out["aphorisms"].extend(str(t) for t in p["aphorisms"])
+        return out
+
     def _derive_posture(obj: dict) -> str:
         w = obj.get("witnesses")
         nonempty = False
@@ -173,11 +254,22 @@ def collect_data(root_dir: str):
         return "witnessed" if nonempty else "informational"
 
     capsules, bundles, profiles, schemas = {}, {}, {}, {}
-    yaml_files = glob.glob(os.path.join(root_dir, "**", "*.yml"), recursive=True) + \
-                 glob.glob(os.path.join(root_dir, "**", "*.yaml"), recursive=True)
+    # One walk for both extensions; the previous pair of recursive globs
+    # traversed the whole tree twice
+    yaml_files = []
+    for dirpath, _dirs, names in os.walk(root_dir):
+        yaml_files.extend(os.path.join(dirpath, n) for n in names
+                          if n.endswith((".yml", ".yaml")))
+
+    # Parse in parallel: file reads are I/O-bound and the C loader releases
+    # the GIL, so threads overlap well on big capsule sets
+    if len(yaml_files) < 4:
+        parsed = [read_yaml(fp) for fp in yaml_files]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            parsed = list(ex.map(read_yaml, yaml_files))
 
-    for filepath in yaml_files:
-        data = read_yaml(filepath)
+    for filepath, data in zip(yaml_files, parsed):
         if not isinstance(data, dict):
             continue
 
@@ -222,6 +314,7 @@ def collect_data(root_dir: str):
             cap = dict(data)
             cap["_file"] = filepath
             cap["posture"] = _derive_posture(cap)
+            cap["_ped"] = _bucket_pedagogy(cap)
             w = cap.get("witnesses")
             if isinstance(w, list):
                 cap["_witness_count"] = len(w)
@@ -267,6 +360,23 @@ def generate_spa(root_dir: str,
 
     print(f"📦 Collecting data from {root_dir}...")
     data = collect_data(root_dir)
+
+    # Externalize capsule YAML sources into sidecar files next to the HTML
+    # instead of embedding every _raw string in the __DATA__ JSON blob; the
+    # viewer fetches them lazily and falls back to a JSON rendering when
+    # fetch is unavailable (e.g. file://).
+    raw_dirname = "capsules_raw"
+    raw_dir = os.path.join(os.path.dirname(output_path) or ".", raw_dirname)
+    ensure_dir(raw_dir)
+    for cap in data["capsules"].values():
+        raw = cap.pop("_raw", "")
+        if not raw:
+            continue
+        fname = str(cap["id"]).replace(os.sep, "_") + ".yml"
+        with open(os.path.join(raw_dir, fname), "w", encoding="utf-8") as f:
+            f.write(raw)
+        cap["_raw_file"] = f"{raw_dirname}/{fname}"
+
     print(f"  ✓ {len(data['capsules'])} capsules")
     print(f"  ✓ {len(data['bundles'])} bundles")
     print(f"  ✓ {len(data['profiles'])} profiles")
@@ -279,7 +389,17 @@ def generate_spa(root_dir: str,
 
     print(f"\n🔧 Rendering SPA...")
     generated_at = datetime.utcnow().isoformat() + "Z"
-    data_json = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    # orjson serializes the nested dicts several times faster than stdlib
+    # json and emits UTF-8 directly; the output is equivalent 2-space
+    # indented JSON either way
+    if HAS_ORJSON:
+        data_json = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=_json_default,
+        ).decode("utf-8")
+    else:
+        data_json = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
 
     # Decide on asset strategy
     if embed_cdn:
@@ -0,0 +1,57 @@
+"""
+Digest canonicalization tests.
+
+Run with: pytest tests/
+"""
+import json
+import pathlib
+import sys
+
+import yaml
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+CAPSULES = ROOT / "capsules"
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import capsule_digest  # noqa: E402
+
+
+def _reference_canonical_json(obj):
+    """Original recursive canonicalizer, kept as the equivalence oracle."""
+    if isinstance(obj, list):
+        return "[" + ",".join(_reference_canonical_json(item) for item in obj) + "]"
+    elif isinstance(obj, dict):
+        keys = sorted(obj.keys())
+        pairs = [json.dumps(k) + ":" + _reference_canonical_json(obj[k]) for k in keys]
+        return "{" + ",".join(pairs) + "}"
+    else:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def test_canonical_json_matches_reference():
+    """json.dumps(sort_keys=True) must be byte-for-byte the old recursive form."""
+    paths = sorted(CAPSULES.rglob("*.yaml"))
+    assert len(paths) > 10, "capsule corpus unexpectedly small — glob broken?"
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            doc = yaml.safe_load(f)
+
+        core = capsule_digest.core_for_digest(doc)
+        assert capsule_digest.canonical_json(core) == _reference_canonical_json(core), \
+            f"{path.name}: canonical JSON diverged from reference"
+
+
+def test_calculate_digest_is_stable():
+    """Digest of a fixed core must not change across releases."""
+    capsule = {
+        "id": "test.digest_v1",
+        "version": "1.0.0",
+        "domain": "test",
+        "title": "Digest test",
+        "statement": "Digests are stable ≥ forever.",
+        "assumptions": ["a", "b"],
+        "pedagogy": [{"kind": "note", "text": "x"}],
+    }
+    digest = capsule_digest.calculate_digest(capsule)
+    assert digest == capsule_digest.calculate_digest(dict(reversed(capsule.items())))
+    assert len(digest) == 64